@@ -1,75 +1,55 @@
 """Age suitability scoring for recommendations."""
-from typing import Dict, Any
+from bisect import bisect_right
+from functools import lru_cache
+import numpy as np
 from models import Place, Activity
 
 
 class AgeScorer:
     """Calculate age suitability multipliers for places and activities."""
-    
+
+    # Age bucket boundaries: <18, 18-24, 25-29, 30-35, 36-39, 40-45, 46-50, 51+
+    AGE_CUTPOINTS = (18, 25, 30, 36, 40, 46, 51)
+
+    # Multipliers indexed by [category_class, age_bucket]. Rows follow the
+    # category class order in models (HIGH_ENERGY, LOW_ENERGY, FAMILY,
+    # EDUCATIONAL, MEDIUM, OTHER); all values already lie within 0.5..1.5.
+    MULT_TABLE = np.array([
+        [0.6, 1.3, 1.3, 1.3, 1.0, 1.0, 1.0, 0.6],       # High-energy (nightlife, clubs)
+        [1.0, 1.0, 1.0, 1.1, 1.1, 1.1, 1.1, 1.1],       # Low-energy (museums, parks)
+        [0.9, 0.9, 1.2, 1.2, 1.2, 1.2, 1.1, 1.1],       # Family-friendly
+        [1.0, 1.0, 1.0, 1.0, 1.0, 1.15, 1.15, 1.15],    # Educational
+        [1.0, 1.0, 1.1, 1.1, 1.1, 1.1, 1.0, 1.0],       # Medium energy
+        [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0],       # Everything else
+    ], dtype=np.float64)
+
     def __init__(self):
         """Initialize age scorer with scoring rules."""
         pass
-    
-    def calculate_multiplier(self, age: int, item: Place | Activity) -> float:
+
+    def age_bucket(self, age: int) -> int:
+        """Map an age onto a column of MULT_TABLE."""
+        return bisect_right(self.AGE_CUTPOINTS, age)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def calculate_multiplier(age_bucket: int, cat_class: int) -> float:
         """
-        Calculate suitability multiplier based on age and item characteristics.
-        
-        Returns multiplier in range 0.5 to 1.5.
+        Calculate suitability multiplier for an age bucket and category class.
+
+        Returns multiplier in range 0.5 to 1.5. Results are memoized since
+        there are only len(MULT_TABLE) * (len(AGE_CUTPOINTS) + 1) distinct inputs.
         """
-        features = item.features
-        energy_level = features.get("energy_level", "medium").lower()
-        age_suitability = features.get("age_suitability_profile", "").lower()
-        category = item.category.lower()
-        
-        multiplier = 1.0  # Base neutral multiplier
-        
-        # High-energy activities (nightlife, clubs, extreme sports)
-        if energy_level == "high" or "nightlife" in age_suitability or "club" in category:
-            if 18 <= age <= 35:
-                multiplier = 1.3  # Boost for young adults
-            elif 36 <= age <= 50:
-                multiplier = 1.0  # Neutral
-            else:  # 51+
-                multiplier = 0.6  # Penalty for older users
-        
-        # Low-energy activities (museums, parks, cultural sites)
-        elif energy_level == "low" or "cultural" in age_suitability or "museum" in category:
-            if age >= 30:
-                multiplier = 1.1  # Slight boost for mature users
-            else:
-                multiplier = 1.0  # Neutral for all ages
-        
-        # Family-friendly activities
-        elif "family" in age_suitability or "family-friendly" in category:
-            if 25 <= age <= 45:
-                multiplier = 1.2  # Boost for family age range
-            elif age < 25:
-                multiplier = 0.9  # Slight penalty for very young
-            else:  # 46+
-                multiplier = 1.1  # Slight boost for grandparents
-        
-        # Educational/cultural activities
-        elif "educational" in age_suitability or "educational" in category:
-            if age >= 40:
-                multiplier = 1.15  # Boost for older users
-            else:
-                multiplier = 1.0  # Neutral for all ages
-        
-        # Medium energy - age-dependent
-        elif energy_level == "medium":
-            if 25 <= age <= 45:
-                multiplier = 1.1  # Slight boost for middle-aged
-            else:
-                multiplier = 1.0  # Neutral
-        
-        # Ensure multiplier stays in valid range
-        return max(0.5, min(1.5, multiplier))
-    
+        return float(AgeScorer.MULT_TABLE[cat_class, age_bucket])
+
+    def multipliers(self, age: int, cat_classes: np.ndarray) -> np.ndarray:
+        """Get multipliers for an array of category classes in one lookup."""
+        return self.MULT_TABLE[cat_classes, self.age_bucket(age)]
+
     def get_multiplier_for_place(self, age: int, place: Place) -> float:
         """Get multiplier for a place."""
-        return self.calculate_multiplier(age, place)
-    
+        return self.calculate_multiplier(self.age_bucket(age), place._cat_class)
+
     def get_multiplier_for_activity(self, age: int, activity: Activity) -> float:
         """Get multiplier for an activity."""
-        return self.calculate_multiplier(age, activity)
-
+        return self.calculate_multiplier(self.age_bucket(age), activity._cat_class)
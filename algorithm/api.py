@@ -5,28 +5,59 @@ Merged FastAPI server:
 
 Speed changes applied (keeps your logic):
 - MediaPipe inference is throttled to a fixed FPS (default 15) instead of every camera loop tick
-- Frames are downscaled before MediaPipe (default target width 640)
+- Frames are downscaled before MediaPipe (default target width 640), and the
+  camera is asked for that resolution up front; flip and downscale are one warpAffine
 - MediaPipe model_complexity lowered to 0 (faster)
 - Lock scope is kept small (only around shared-state writes/reads)
-- Camera loop no longer sleeps a fixed 33ms (uses tiny sleep to avoid pegging CPU)
+- Camera loop is paced to the camera frame rate and always grabs the newest frame
+  (buffer size 1, grab every tick, decode only frames that are inferred)
+- MediaPipe is skipped on frames where the scene hasn't changed and no hand was seen recently
+- Capture (decode/resize/convert) and MediaPipe run on separate threads joined by a
+  1-slot queue, so preparing the next frame overlaps the current inference
+- OpenCV runs single-threaded (its thread pool only adds overhead on one small frame)
+- Swipe detection is a Numba kernel over a preallocated ring buffer (plain Python if numba is missing)
 """
 
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from collections import deque
+from typing import List, Optional, Dict, Any, Tuple
+from collections import Counter, OrderedDict
+from itertools import takewhile
+import asyncio
+import os
+import queue
 import time
 import threading
 
+# Per-frame OpenCV work is a single small resize/convert; a thread pool only
+# adds fork/join overhead there, so cap it before cv2 loads its runtime
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("OPENCV_FOR_THREADS_NUM", "1")
+
 import cv2
+cv2.setNumThreads(1)
 import mediapipe as mp
 import numpy as np
 
-from fastapi import FastAPI, HTTPException
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator: run the kernel as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 
 from database import Database
 from recommendation_engine import RecommendationEngine
@@ -38,58 +69,235 @@ from webscraper import webscrape_location, ActivityGenerator
 # App setup
 # -----------------------------------------------------------------------------
 
-app = FastAPI(title="Trippy Merged API", version="1.0.0")
+app = FastAPI(
+    title="Trippy Merged API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
+
+# Browsers call this API without cookies, so a plain "*" needs no credentials
+# (and no per-request origin echo); set ALLOWED_ORIGINS to lock it down
+_allowed_origins = [o.strip() for o in os.getenv("ALLOWED_ORIGINS", "").split(",") if o.strip()]
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=_allowed_origins or ["*"],
+    allow_credentials=bool(_allowed_origins),
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Recommendation lists compress well; small polled responses stay uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+@app.exception_handler(Exception)
+async def _unhandled_error(request: Request, exc: Exception):
+    """Answer any uncaught endpoint error with a plain 500.
+
+    Starlette re-raises after this response is sent, so the server still logs
+    the traceback; HTTPExceptions raised on purpose keep their own status.
+    """
+    return ORJSONResponse({"detail": "Internal server error"}, status_code=500)
 
 db = Database()
 engine = RecommendationEngine(db)
 
 
+# -----------------------------------------------------------------------------
+# Destination item-id cache
+# -----------------------------------------------------------------------------
+
+# Destination contents only change when scraping runs, so the id sets and
+# id -> item maps are rebuilt at most every _DEST_TTL seconds instead of on
+# every request. Entries are (built_at, place_ids, item_ids, places_by_id,
+# activities_by_id).
+_DEST_TTL = 30.0
+_DEST_IDS_CACHE: Dict[str, Tuple[float, frozenset, frozenset, Dict[str, Any], Dict[str, Any]]] = {}
+
+
+def _dest_entry(destination: str) -> Tuple[float, frozenset, frozenset, Dict[str, Any], Dict[str, Any]]:
+    """Return the cache entry for a destination, rebuilding it once _DEST_TTL expires."""
+    key = destination.lower()
+    cached = _DEST_IDS_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _DEST_TTL:
+        return cached
+
+    places, activities = db.get_items_by_destination(destination)
+    places_by_id = {p.id: p for p in places}
+    activities_by_id = {a.id: a for a in activities}
+    place_ids = frozenset(places_by_id)
+    item_ids = place_ids | frozenset(activities_by_id)
+    entry = (time.monotonic(), place_ids, item_ids, places_by_id, activities_by_id)
+    _DEST_IDS_CACHE[key] = entry
+    return entry
+
+
+def _dest_item_ids(destination: str) -> frozenset:
+    """Return the ids of all places and activities in a destination."""
+    return _dest_entry(destination)[2]
+
+
+def _dest_items_by_id(destination: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Return (places_by_id, activities_by_id) for a destination."""
+    entry = _dest_entry(destination)
+    return entry[3], entry[4]
+
+
+def _warm_dest_cache():
+    """Build the cache entry for every known destination (run at startup)."""
+    for destination in db.get_destinations():
+        _dest_entry(destination)
+
+
+def _dest_counts(destination: str) -> Tuple[int, int]:
+    """Return (num_places, num_activities) for a destination."""
+    entry = _dest_entry(destination)
+    return len(entry[3]), len(entry[4])
+
+
+def _invalidate_dest(destination: str):
+    """Drop cached data for a destination (call after its items change)."""
+    key = destination.lower()
+    _DEST_IDS_CACHE.pop(key, None)
+    with _REC_CACHE_LOCK:
+        for rec_key in [k for k in _REC_CACHE if k[2] == key]:
+            del _REC_CACHE[rec_key]
+
+
+# -----------------------------------------------------------------------------
+# Recommendation result cache
+# -----------------------------------------------------------------------------
+
+# Collaborative scores read every user's interactions, so engine results are
+# memoized on the database-wide interaction version (LRU, _REC_CACHE_MAXSIZE):
+# any swipe by anyone moves the version and makes older entries unreachable.
+_REC_CACHE_MAXSIZE = 128
+_REC_CACHE: "OrderedDict[tuple, list]" = OrderedDict()
+_REC_CACHE_LOCK = threading.Lock()
+
+
+def _cached_recommendations(user: User, destination: str, top_n: int) -> list:
+    """engine.get_recommendations, memoized until the next interaction by any user."""
+    key = (user.id, destination.lower(), user.age, db.get_interaction_version(), top_n)
+    with _REC_CACHE_LOCK:
+        recommendations = _REC_CACHE.get(key)
+        if recommendations is not None:
+            _REC_CACHE.move_to_end(key)
+            return recommendations
+
+    recommendations = engine.get_recommendations(user, destination, top_n)
+
+    with _REC_CACHE_LOCK:
+        _REC_CACHE[key] = recommendations
+        if len(_REC_CACHE) > _REC_CACHE_MAXSIZE:
+            _REC_CACHE.popitem(last=False)
+    return recommendations
+
+
+def _invalidate_recommendations():
+    """Drop all memoized recommendations (call after any interaction)."""
+    with _REC_CACHE_LOCK:
+        _REC_CACHE.clear()
+
+
+# -----------------------------------------------------------------------------
+# Response helpers
+# -----------------------------------------------------------------------------
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first, via partial selection."""
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(scores):
+        top = np.argpartition(-scores, k - 1)[:k]
+        return top[np.argsort(-scores[top], kind="stable")]
+    return np.argsort(-scores, kind="stable")
+
+
+def _tally_ratings(interactions: List[Interaction]) -> Tuple[int, int]:
+    """Count (likes, dislikes) among interactions in one pass."""
+    likes = dislikes = 0
+    for inter in interactions:
+        rating = inter.rating
+        likes += rating == 1
+        dislikes += rating == -1
+    return likes, dislikes
+
+
+def _destination_interactions(user_id: str, destination: str) -> List[Interaction]:
+    """A user's interactions with the items of one destination (blocking reads)."""
+    return db.get_user_interactions_for_items(user_id, _dest_item_ids(destination))
+
+
+def _serialize_item(item, score) -> Dict[str, Any]:
+    """Build the JSON dict for a recommended place or activity."""
+    item_dict = {
+        "id": item.id,
+        "name": item.name,
+        "category": item.category,
+        "description": item.description or "",
+        "features": item.features,
+        "score": score,  # orjson encodes numpy scalars natively
+    }
+
+    if item.kind == "place":
+        item_dict["location"] = item.location
+    else:
+        item_dict["placeId"] = item.place_id
+    item_dict["type"] = item.kind
+
+    return item_dict
+
+
+def _serialize_recommendations(recommendations) -> List[Dict[str, Any]]:
+    """Serialize an engine result list of (item, score) pairs."""
+    return [_serialize_item(item, score) for item, score in recommendations]
+
+
 # -----------------------------------------------------------------------------
 # Recommendation engine models
 # -----------------------------------------------------------------------------
 
-class UserPreferences(BaseModel):
+class _RequestModel(BaseModel):
+    # Request bodies are read-only once parsed; unknown client fields are dropped
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
+class UserPreferences(_RequestModel):
     userId: str
     age: Optional[int] = 25
-    likedItems: List[str] = []
-    dislikedItems: List[str] = []
-    travelHistory: List[str] = []
+    likedItems: List[str] = Field(default_factory=list)
+    dislikedItems: List[str] = Field(default_factory=list)
+    travelHistory: List[str] = Field(default_factory=list)
 
 
-class RecommendationRequest(BaseModel):
+class RecommendationRequest(_RequestModel):
     user: UserPreferences
     destination: str
     topN: int = 20
 
 
-class SwipeAction(BaseModel):
+class SwipeAction(_RequestModel):
     userId: str
     itemId: str
     action: str
     destination: str
+    itemType: Optional[str] = None  # "place" | "activity", as rendered on the card
 
 
-class ConfidenceCheckRequest(BaseModel):
+class ConfidenceCheckRequest(_RequestModel):
     userId: str
     destination: str
 
 
-class MultiUserRecommendationRequest(BaseModel):
+class MultiUserRecommendationRequest(_RequestModel):
     userId: str
     participantPreferences: List[UserPreferences]
     destination: str
     topN: int = 20
 
 
-class MultiUserConfidenceCheckRequest(BaseModel):
+class MultiUserConfidenceCheckRequest(_RequestModel):
     participantIds: List[str]
     destination: str
 
@@ -98,14 +306,47 @@ class MultiUserConfidenceCheckRequest(BaseModel):
 # Hand tracker (camera + mediapipe)
 # -----------------------------------------------------------------------------
 
+@njit(cache=True, nogil=True, fastmath=True, boundscheck=False)
+def _detect_swipe_nb(xs, ys, head, fill, min_frames, required_fraction, min_dx, max_dy):
+    """
+    Classify the last `min_frames` wrist samples of a ring buffer.
+
+    `xs`/`ys` are the ring's coordinate arrays, `head` the next write slot and
+    `fill` the number of valid samples. Returns 0=none, 1=right, 2=left.
+    """
+    if fill < min_frames:
+        return 0
+
+    size = xs.shape[0]
+    first = (head - min_frames) % size
+    last = (head - 1) % size
+
+    total_dx = xs[last] - xs[first]
+    total_dy = ys[last] - ys[first]
+    if abs(total_dx) < min_dx or abs(total_dy) > max_dy:
+        return 0
+
+    direction = 1.0 if total_dx > 0 else -1.0
+    hits = 0
+    prev = xs[first]
+    for k in range(1, min_frames):
+        cur = xs[(first + k) % size]
+        if (cur - prev) * direction > 0:
+            hits += 1
+        prev = cur
+
+    if hits / (min_frames - 1) < required_fraction:
+        return 0
+
+    return 1 if total_dx > 0 else 2
+
+
+
 class HandTracker:
-    FINGER_TIPS = {
-        "thumb": 4,
-        "index": 8,
-        "middle": 12,
-        "ring": 16,
-        "pinky": 20,
-    }
+    _NO_EVENT = (0, "none", 0, 0)
+
+    # Landmark indices of the thumb, index, middle, ring and pinky tips
+    FINGER_TIP_IDS: tuple[int, ...] = (4, 8, 12, 16, 20)
 
     def __init__(
         self,
@@ -118,16 +359,48 @@ class HandTracker:
         self.cap = cv2.VideoCapture(cam_index)
         if not self.cap.isOpened():
             raise RuntimeError("Failed to open camera")
+        # Keep only the newest frame in the driver queue so we never process stale frames
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
         # -------------------------
         # Speed knobs
         # -------------------------
+        self._grab_period = 1.0 / 30.0
         self._infer_fps = float(max(1.0, infer_fps))
-        self._infer_period = 1.0 / self._infer_fps
-        self._last_infer_t = 0.0
+        # Tracker timings are integer monotonic_ns: immune to wall-clock steps
+        self._infer_period_ns = int(1e9 / self._infer_fps)
+        self._last_infer_ns = -self._infer_period_ns
 
         self._target_width = int(max(160, target_width))
-        self._downscale_interpolation = cv2.INTER_AREA
+        # Mild shrinks go through one fused flip+resize warpAffine (linear is fine
+        # for landmark detection); below this scale INTER_AREA is worth a second pass
+        self._downscale_interpolation = cv2.INTER_LINEAR
+        self._area_below_scale = 0.6
+
+        # Static-scene skip: with no hand seen for _hand_grace_ns, a frame whose
+        # 32x18 grey thumbnail barely differs from the last one isn't inferred
+        self._thumb_size = (32, 18)
+        self._prev_thumb: Optional[np.ndarray] = None
+        self._static_diff_thresh = 2.0
+        self._hand_grace_ns = 2_000_000_000
+        self._last_hand_seen_ns = 0
+        self._warp: Optional[tuple] = None    # ((w, h), matrix, dsize, scale) for the current camera size
+
+        # Ask the camera for compressed MJPG frames near the inference size (the
+        # codec must be set before the size on some backends); drivers that ignore
+        # this still get downscaled in _mirror_downscale_for_inference
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self._target_width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self._target_width * 9 // 16)
+
+        # Reused decode buffer (allocated on the first frame)
+        self._frame_buf: Optional[np.ndarray] = None
+
+        # Capture -> inference hand-off: a 1-slot queue holding only the newest
+        # RGB frame, plus a pool of RGB buffers returned once MediaPipe is done
+        # with them (at most three exist: filling, queued, being inferred)
+        self._frames: "queue.Queue[np.ndarray]" = queue.Queue(maxsize=1)
+        self._free_rgb: "queue.SimpleQueue[np.ndarray]" = queue.SimpleQueue()
 
         # MediaPipe setup (speed: complexity=0)
         self.mp_hands = mp.solutions.hands
@@ -139,11 +412,17 @@ class HandTracker:
             min_tracking_confidence=0.60,     # speed change (less strict)
         )
 
-        # Swipe detection state
-        self.swipe_queue = deque(maxlen=queue_len)
-        self._last_swipe_time = 0.0
-        self._swipe_cooldown_s = 1.5
-        self.last_n_frames = deque(maxlen=12)
+        # Swipe detection state: ring buffer of wrist positions (one array per axis)
+        self._xs = np.zeros(queue_len, dtype=np.float32)
+        self._ys = np.zeros(queue_len, dtype=np.float32)
+        self._buf_head = 0
+        self._buf_fill = 0
+        self._swipe_cooldown_ns = 1_500_000_000
+        self._last_swipe_ns = -self._swipe_cooldown_ns
+        self._cooldown_frames = 0             # tracked frames left before another swipe may fire
+        # Compile the swipe kernel for these buffer types now so the first
+        # tracked frame doesn't pay for it (empty ring -> returns immediately)
+        _detect_swipe_nb(self._xs, self._ys, 0, 0, 8, 0.40, 0.12, 0.12)
 
         # Position state
         self.last_known_x = 0.50
@@ -152,49 +431,68 @@ class HandTracker:
         # Current swipe state
         self.current_swipe = 0
         self.current_direction = "none"
+
+        # (x, y, swipe, direction) snapshot, republished as one tuple per frame so
+        # readers can unpack it without taking the lock
+        self._state = (self.last_known_x, self.last_known_y, 0, "none")
         
+        # Latched swipe event as one (swipe 0|1|2, direction, event_id, set_time)
+        # tuple: written under the lock, read lock-free by pollers
         self._event_id = 0
-        self._pending_swipe: int = 0          # 0|1|2
-        self._pending_direction: str = "none"
-        self._pending_event_id: int = 0
-        self._pending_set_time: float = 0.0
-        self._pending_ttl_s: float = 1.25     # how long we keep an un-acked swipe available
+        self._pending: tuple = self._NO_EVENT
+        self._pending_ttl_ns: int = 1_250_000_000  # how long we keep an un-acked swipe available
 
         # Thread control
         self.running = False
         self.thread = None
+        self.infer_thread = None
         self.lock = threading.Lock()
 
-    @staticmethod
-    def _lm_xy(hand_lms, idx, w, h):
-        lm = hand_lms.landmark[idx]
-        return np.array([lm.x * w, lm.y * h], dtype=np.float32)
-
-    def _compute_hand_center_wrist(self, hand_lms, w, h):
-        """For swipe detection - uses wrist"""
-        wrist = self._lm_xy(hand_lms, 0, w, h)
-        return wrist / np.array([w, h], dtype=np.float32)
-
-    def _compute_hand_center_fingertips(self, hand_lms, w, h):
-        """For position tracking - uses fingertips average"""
-        fingertip_positions = []
-        for _, tip_idx in self.FINGER_TIPS.items():
-            tip_pos = self._lm_xy(hand_lms, tip_idx, w, h)
-            fingertip_positions.append(tip_pos)
-
-        avg_position = np.mean(fingertip_positions, axis=0)
-        return avg_position / np.array([w, h], dtype=np.float32)
-
-    def _downscale_for_inference(self, frame_bgr: np.ndarray):
-        """Downscale frame before MediaPipe for speed. Returns (small_frame, scale)."""
+    def _compute_hand_center_wrist(self, hand_lms):
+        """For swipe detection - uses wrist (landmarks are already normalized)"""
+        lm = hand_lms.landmark[0]
+        return lm.x, lm.y
+
+    def _compute_hand_center_fingertips(self, hand_lms):
+        """For position tracking - uses fingertips average (normalized)"""
+        landmarks = hand_lms.landmark
+        sx = sy = 0.0
+        for tip_idx in self.FINGER_TIP_IDS:
+            lm = landmarks[tip_idx]
+            sx += lm.x
+            sy += lm.y
+        return sx * 0.2, sy * 0.2
+
+    def _mirror_downscale_for_inference(self, frame_bgr: np.ndarray):
+        """
+        Mirror and downscale frame before MediaPipe (one warpAffine pass, or
+        INTER_AREA resize + in-place flip for large shrinks).
+        Returns (small_frame, scale).
+        """
         h, w = frame_bgr.shape[:2]
         if w <= self._target_width:
-            return frame_bgr, 1.0
-        scale = self._target_width / float(w)
-        new_w = self._target_width
-        new_h = int(round(h * scale))
-        small = cv2.resize(
-            frame_bgr, (new_w, new_h), interpolation=self._downscale_interpolation
+            return cv2.flip(frame_bgr, 1), 1.0
+
+        if self._warp is None or self._warp[0] != (w, h):
+            scale = self._target_width / float(w)
+            new_h = int(round(h * scale))
+            # x' = (w - 1 - x) * scale, y' = y * scale
+            matrix = np.array(
+                [[-scale, 0.0, (w - 1) * scale], [0.0, scale, 0.0]], dtype=np.float32
+            )
+            self._warp = ((w, h), matrix, (self._target_width, new_h), scale)
+
+        _, matrix, dsize, scale = self._warp
+        if scale < self._area_below_scale:
+            small = cv2.resize(frame_bgr, dsize, interpolation=cv2.INTER_AREA)
+            return cv2.flip(small, 1, dst=small), scale
+
+        small = cv2.warpAffine(
+            frame_bgr,
+            matrix,
+            dsize,
+            flags=self._downscale_interpolation,
+            borderMode=cv2.BORDER_REPLICATE,
         )
         return small, scale
 
@@ -205,158 +503,203 @@ class HandTracker:
         min_total_dx_norm: float = 0.12,
         max_total_dy_norm: float = 0.12,
     ):
-        # Snapshot quickly (lock only for copying)
+        # The kernel is a handful of scalar ops, so run it under the lock
+        # rather than copying the ring out first
         with self.lock:
-            if len(self.swipe_queue) < min_frames:
-                return 0
-            samples = list(self.swipe_queue)[-min_frames:]
-
-        xs = np.empty((min_frames,), dtype=np.float32)
-        ys = np.empty((min_frames,), dtype=np.float32)
-
-        for i, s in enumerate(samples):
-            center = s.get("center")
-            if center is None:
-                return 0
-            xs[i] = center[0]
-            ys[i] = center[1]
-
-        total_dx = float(xs[-1] - xs[0])
-        total_dy = float(ys[-1] - ys[0])
-
-        if abs(total_dx) < min_total_dx_norm or abs(total_dy) > max_total_dy_norm:
-            return 0
+            return _detect_swipe_nb(
+                self._xs,
+                self._ys,
+                self._buf_head,
+                self._buf_fill,
+                min_frames,
+                required_fraction,
+                min_total_dx_norm,
+                max_total_dy_norm,
+            )
 
-        step_dx = xs[1:] - xs[:-1]
-        direction = 1.0 if total_dx > 0 else -1.0
-        if float(np.mean((step_dx * direction) > 0)) < required_fraction:
-            return 0
+    def _take_rgb_buf(self, shape) -> np.ndarray:
+        """Get a free RGB buffer of the given shape, allocating only when none is free."""
+        try:
+            buf = self._free_rgb.get_nowait()
+            if buf.shape == shape:
+                return buf
+        except queue.Empty:
+            pass
+        return np.empty(shape, dtype=np.uint8)
+
+    def _scene_is_static(self, small_bgr: np.ndarray, now_ns: int) -> bool:
+        """True if nothing moved since the last inferred tick and no hand was seen recently."""
+        thumb = cv2.cvtColor(
+            cv2.resize(small_bgr, self._thumb_size, interpolation=cv2.INTER_AREA),
+            cv2.COLOR_BGR2GRAY,
+        )
+        prev, self._prev_thumb = self._prev_thumb, thumb
+        if prev is None or (now_ns - self._last_hand_seen_ns) <= self._hand_grace_ns:
+            return False
+        return float(cv2.absdiff(thumb, prev).mean()) < self._static_diff_thresh
+
+    def capture_frame(self):
+        """Grab, decode and convert one frame, then hand it to the inference thread."""
+        # Grab every tick so the driver queue stays fresh; decoding is deferred
+        if not self.cap.grab():
+            return
 
-        return 1 if total_dx > 0 else 2  # 1=right, 2=left
+        # Speed change: run MediaPipe only at fixed infer FPS
+        now = time.monotonic_ns()
+        if (now - self._last_infer_ns) < self._infer_period_ns:
+            return
+        self._last_infer_ns = now
 
-    def process_frame(self):
-        """Process one frame from the camera (fast path)."""
-        ok, frame = self.cap.read()
+        ok, frame = self.cap.retrieve(self._frame_buf)
         if not ok or frame is None or frame.size == 0:
             return
+        self._frame_buf = frame
 
-        frame = cv2.flip(frame, 1)
+        # Speed change: mirror + downscale in one pass before any other full-frame work
+        small_bgr, _scale = self._mirror_downscale_for_inference(frame)
 
-        # Speed change: run MediaPipe only at fixed infer FPS
-        now = time.time()
-        if (now - self._last_infer_t) < self._infer_period:
+        # Speed change: an empty, unchanged scene can't contain a new hand
+        if self._scene_is_static(small_bgr, now):
             return
-        self._last_infer_t = now
 
-        # Speed change: downscale before inference
-        small_bgr, _scale = self._downscale_for_inference(frame)
-        sh, sw = small_bgr.shape[:2]
+        rgb = cv2.cvtColor(
+            small_bgr, cv2.COLOR_BGR2RGB, dst=self._take_rgb_buf(small_bgr.shape)
+        )
+
+        # Drop-if-full: replace a frame inference hasn't picked up yet with this newer one
+        try:
+            self._frames.put_nowait(rgb)
+        except queue.Full:
+            try:
+                self._free_rgb.put(self._frames.get_nowait())
+            except queue.Empty:
+                pass
+            self._frames.put_nowait(rgb)  # only this thread puts, so the slot is free now
 
-        rgb = cv2.cvtColor(small_bgr, cv2.COLOR_BGR2RGB)
-        rgb.flags.writeable = False
+    def process_frame(self, rgb: np.ndarray):
+        """Run MediaPipe on one RGB frame and update tracking state (fast path)."""
         result = self.hands.process(rgb)
-        rgb.flags.writeable = True
+        self._free_rgb.put(rgb)
 
         swipe = 0
 
         if result.multi_hand_landmarks:
+            self._last_hand_seen_ns = time.monotonic_ns()
             hand_lms = result.multi_hand_landmarks[0]
 
-            # Position (fingertips avg) on SMALL frame, normalized => equivalent
-            center_norm = self._compute_hand_center_fingertips(hand_lms, sw, sh)
-            x_frac = float(center_norm[0])
-            y_frac = float(center_norm[1])
+            # Position (fingertips avg), normalized by MediaPipe
+            x_frac, y_frac = self._compute_hand_center_fingertips(hand_lms)
 
             x_frac = min(1.0, max(0.0, x_frac))
             y_frac = min(1.0, max(0.0, y_frac))
 
-            # Swipe detection (wrist) on SMALL frame, normalized => equivalent
-            wrist_norm = self._compute_hand_center_wrist(hand_lms, sw, sh)
+            # Swipe detection (wrist), normalized by MediaPipe
+            wrist_norm = self._compute_hand_center_wrist(hand_lms)
 
             # Lock only around shared-state writes
             with self.lock:
                 self.last_known_x = x_frac
                 self.last_known_y = y_frac
-                self.swipe_queue.append({"center": wrist_norm})
+                self._xs[self._buf_head], self._ys[self._buf_head] = wrist_norm
+                self._buf_head = (self._buf_head + 1) % len(self._xs)
+                self._buf_fill = min(self._buf_fill + 1, len(self._xs))
 
             swipe = self.detect_swipe()
 
             # Cooldown + debouncing (tiny lock)
-            now2 = time.time()
+            now2 = time.monotonic_ns()
             with self.lock:
-                if swipe != 0 and (now2 - self._last_swipe_time) >= self._swipe_cooldown_s:
-                    self._last_swipe_time = now2
+                if swipe != 0 and (now2 - self._last_swipe_ns) >= self._swipe_cooldown_ns:
+                    self._last_swipe_ns = now2
                 else:
                     swipe = 0
 
-                if swipe != 0 and any(s != 0 for s in self.last_n_frames):
+                if swipe != 0 and self._cooldown_frames > 0:
                     swipe = 0
-                self.last_n_frames.append(swipe)
+                if swipe != 0:
+                    self._cooldown_frames = 12
+                elif self._cooldown_frames > 0:
+                    self._cooldown_frames -= 1
 
                 self.current_swipe = swipe
                 self.current_direction = "right" if swipe == 1 else "left" if swipe == 2 else "none"
+                self._state = (x_frac, y_frac, swipe, self.current_direction)
 
                 # --- NEW: latch swipe as an event (so polling can't miss it) ---
                 if swipe != 0:
-                    # Don't allow a second swipe to overwrite an un-acked one
-                    if self._pending_swipe == 0:
+                    # Don't allow a second swipe to overwrite an un-acked (live) one
+                    pending_swipe, _, _, set_time = self._pending
+                    now3 = time.monotonic_ns()
+                    if pending_swipe == 0 or (now3 - set_time) > self._pending_ttl_ns:
                         self._event_id += 1
-                        self._pending_swipe = int(swipe)
-                        self._pending_direction = self.current_direction
-                        self._pending_event_id = int(self._event_id)
-                        self._pending_set_time = time.time()
+                        self._pending = (int(swipe), self.current_direction, self._event_id, now3)
         else:
             # No hand detected
             with self.lock:
-                self.swipe_queue.clear()
+                self._buf_fill = 0
                 self.current_swipe = 0
                 self.current_direction = "none"
+                self._state = (self.last_known_x, self.last_known_y, 0, "none")
 
     def get_swipe_event(self):
-        """Return a latched swipe event until consumed or TTL expires."""
-        with self.lock:
-            if self._pending_swipe != 0:
-                # TTL expiry safety (prevents a stuck swipe if client disappears)
-                if (time.time() - self._pending_set_time) > self._pending_ttl_s:
-                    self._pending_swipe = 0
-                    self._pending_direction = "none"
-                    self._pending_event_id = 0
-
-            return (
-                int(self._pending_swipe),
-                str(self._pending_direction),
-                int(self._pending_event_id),
-            )
+        """Return a latched swipe event until consumed or TTL expires (lock-free)."""
+        swipe, direction, event_id, set_time = self._pending
+        # TTL expiry safety (prevents a stuck swipe if client disappears)
+        if swipe != 0 and (time.monotonic_ns() - set_time) > self._pending_ttl_ns:
+            return 0, "none", 0
+        return swipe, direction, event_id
 
     def consume_swipe_event(self, event_id: int) -> bool:
         """Consume only if the event_id matches the currently pending one."""
         with self.lock:
-            if self._pending_swipe == 0:
+            swipe, _, pending_event_id, set_time = self._pending
+            if swipe == 0 or (time.monotonic_ns() - set_time) > self._pending_ttl_ns:
+                self._pending = self._NO_EVENT
                 return True
-            if int(event_id) != int(self._pending_event_id):
+            if int(event_id) != pending_event_id:
                 return False
-            self._pending_swipe = 0
-            self._pending_direction = "none"
-            self._pending_event_id = 0
+            self._pending = self._NO_EVENT
             return True
 
     def camera_loop(self):
         print("Camera loop started")
+        next_t = time.monotonic()
         while self.running:
             try:
-                self.process_frame()
-                # Speed change: tiny sleep only (keeps latency low, avoids 100% CPU spin)
-                time.sleep(0.002)
+                self.capture_frame()
+                # Sleep only for what is left of this frame's budget
+                next_t += self._grab_period
+                delay = next_t - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_t = time.monotonic()  # fell behind; don't try to catch up
             except Exception as e:
                 print(f"Error in camera loop: {e}")
                 time.sleep(0.05)
         print("Camera loop stopped")
 
+    def inference_loop(self):
+        # Runs MediaPipe back-to-back on whatever capture_frame hands over, so
+        # decode/resize/convert of the next frame overlaps the current forward pass
+        while self.running:
+            try:
+                rgb = self._frames.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            try:
+                self.process_frame(rgb)
+            except Exception as e:
+                print(f"Error in inference loop: {e}")
+                time.sleep(0.05)
+
     def start(self):
         if self.running:
             return
         self.running = True
         self.thread = threading.Thread(target=self.camera_loop, daemon=True)
+        self.infer_thread = threading.Thread(target=self.inference_loop, daemon=True)
+        self.infer_thread.start()
         self.thread.start()
         print("Hand tracker started")
 
@@ -364,15 +707,17 @@ class HandTracker:
         self.running = False
         if self.thread:
             self.thread.join(timeout=2.0)
+        if self.infer_thread:
+            self.infer_thread.join(timeout=2.0)
         print("Hand tracker stopped")
 
     def get_position(self):
-        with self.lock:
-            return self.last_known_x, self.last_known_y
+        x, y, _, _ = self._state
+        return x, y
 
     def get_swipe(self):
-        with self.lock:
-            return self.current_swipe, self.current_direction
+        _, _, swipe, direction = self._state
+        return swipe, direction
 
     def close(self):
         self.stop()
@@ -396,6 +741,9 @@ async def startup_event():
         print(f"✗ Failed to initialize hand tracker: {e}")
         tracker = None
 
+    # Pay the destination index build now instead of on the first real request
+    await run_in_threadpool(_warm_dest_cache)
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -433,364 +781,235 @@ async def health_check():
 @app.post("/api/recommendations")
 async def get_recommendations(request: RecommendationRequest):
     """Get recommendations for a user at a destination."""
-    try:
-        user = db.get_user(request.user.userId)
-
-        if not user:
-            user = User(
-                id=request.user.userId,
-                age=request.user.age or 25,
-                preferences=request.user.likedItems,
-                travel_history=request.user.travelHistory or [request.destination],
-            )
-            db.save_user(user)
-
-        places = db.get_places_by_destination(request.destination)
-        activities = db.get_activities_by_destination(request.destination)
-
-        if not places or not activities:
-            webscrape_location(db, request.destination, max_activities=10)
-
-        recommendations = engine.get_recommendations(user, request.destination, request.topN)
-
-        result = []
-        for item, score in recommendations:
-            item_dict = {
-                "id": item.id,
-                "name": item.name,
-                "category": item.category,
-                "description": item.description or "",
-                "features": item.features,
-                "score": float(score),
-            }
+    user = await run_in_threadpool(
+        db.ensure_user,
+        request.user.userId,
+        request.user.age or 25,
+        request.user.likedItems,
+        request.user.travelHistory or [request.destination],
+    )
 
-            if hasattr(item, "location"):
-                item_dict["location"] = item.location
-                item_dict["type"] = "place"
-            else:
-                item_dict["placeId"] = item.place_id
-                item_dict["type"] = "activity"
+    num_places, num_activities = await run_in_threadpool(_dest_counts, request.destination)
 
-            result.append(item_dict)
+    if not num_places or not num_activities:
+        await run_in_threadpool(webscrape_location, db, request.destination, max_activities=10)
+        _invalidate_dest(request.destination)
 
-        return {"recommendations": result}
+    recommendations = await run_in_threadpool(
+        _cached_recommendations, user, request.destination, request.topN
+    )
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"recommendations": _serialize_recommendations(recommendations)}
 
 
 @app.post("/api/swipe")
-async def handle_swipe(action: SwipeAction):
+async def handle_swipe(action: SwipeAction, background_tasks: BackgroundTasks):
     """Handle user swipe action (like/dislike)."""
-    try:
-        user = db.get_user(action.userId)
-
-        if not user:
-            user = User(
-                id=action.userId,
-                age=25,
-                preferences=[],
-                travel_history=[action.destination],
-            )
-            db.save_user(user)
-
-        rating = 1 if action.action == "like" else -1
+    await run_in_threadpool(db.ensure_user, action.userId, 25, [], [action.destination])
 
-        places = db.get_places_by_destination(action.destination)
-        activities = db.get_activities_by_destination(action.destination)
-        place_ids = {p.id for p in places}
-        activity_ids = {a.id for a in activities}
+    rating = 1 if action.action == "like" else -1
 
-        item_type = "place" if action.itemId in place_ids else "activity"
+    item_type = action.itemType
+    if item_type not in ("place", "activity"):
+        item_type = db.get_item_type(action.itemId)
 
-        interaction = Interaction(
-            user_id=action.userId,
-            item_id=action.itemId,
-            item_type=item_type,
-            rating=rating,
-            timestamp=datetime.now().isoformat(),
-        )
+    interaction = Interaction(
+        user_id=action.userId,
+        item_id=action.itemId,
+        item_type=item_type,
+        rating=rating,
+        timestamp=datetime.now().isoformat(),
+    )
 
-        db.add_interaction(interaction)
+    # Record the swipe in memory before answering: the client runs a confidence
+    # check right after this returns and it must count this swipe
+    db.add_interaction(interaction, persist=False)
+    # Every user's collaborative scores can change, and all cached entries are
+    # keyed on the previous interaction version, so none can hit again
+    _invalidate_recommendations()
 
-        return {"success": True}
+    # The client doesn't wait on the JSON file write; do it after the response is sent
+    background_tasks.add_task(db.save)
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"success": True}
 
 
 @app.post("/api/confidence-check")
 async def check_confidence(request: ConfidenceCheckRequest):
     """Check user confidence metrics."""
-    try:
-        user = db.get_user(request.userId)
-        if not user:
-            return {"likes": 0, "dislikes": 0, "total": 0, "confidence_ratio": 0.0, "meets_threshold": False}
-
-        all_interactions = db.get_user_interactions(request.userId)
-
-        places = db.get_places_by_destination(request.destination)
-        activities = db.get_activities_by_destination(request.destination)
-        destination_item_ids = {p.id for p in places} | {a.id for a in activities}
+    user = db.get_user(request.userId)
+    if not user:
+        return {"likes": 0, "dislikes": 0, "total": 0, "confidence_ratio": 0.0, "meets_threshold": False}
 
-        destination_interactions = [inter for inter in all_interactions if inter.item_id in destination_item_ids]
+    interactions = await run_in_threadpool(
+        _destination_interactions, request.userId, request.destination
+    )
 
-        likes = sum(1 for inter in destination_interactions if inter.rating == 1)
-        dislikes = sum(1 for inter in destination_interactions if inter.rating == -1)
-        total = likes + dislikes
+    likes, dislikes = _tally_ratings(interactions)
+    total = likes + dislikes
 
-        confidence_ratio = (likes / total) if total > 0 else 0.0
-        meets_threshold = likes >= 20 and confidence_ratio >= 0.95
+    confidence_ratio = (likes / total) if total > 0 else 0.0
+    meets_threshold = likes >= 20 and confidence_ratio >= 0.95
 
-        return {
-            "likes": likes,
-            "dislikes": dislikes,
-            "total": total,
-            "confidence_ratio": confidence_ratio,
-            "meets_threshold": meets_threshold,
-        }
-
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "likes": likes,
+        "dislikes": dislikes,
+        "total": total,
+        "confidence_ratio": confidence_ratio,
+        "meets_threshold": meets_threshold,
+    }
 
 
 @app.post("/api/high-confidence-items")
 async def get_high_confidence_items(request: ConfidenceCheckRequest):
     """Get liked items + high-confidence recommendations (score >= 0.8)."""
-    try:
-        user = db.get_user(request.userId)
-        if not user:
-            return {"items": []}
-
-        all_interactions = db.get_user_interactions(request.userId)
-
-        places = db.get_places_by_destination(request.destination)
-        activities = db.get_activities_by_destination(request.destination)
-
-        liked_item_ids = {inter.item_id for inter in all_interactions if inter.rating == 1}
-        user_item_ids = {inter.item_id for inter in all_interactions}
-
-        recommendations = engine.get_recommendations(user, request.destination, top_n=100)
-        high_confidence_items = [
-            (item, score) for item, score in recommendations
-            if score >= 0.8 and item.id not in user_item_ids
-        ]
-
-        result_items = []
-        item_ids_added = set()
-
-        place_id_set = {p.id for p in places}
-        activity_id_set = {a.id for a in activities}
-
-        for item_id in liked_item_ids:
-            item = None
-            if item_id in place_id_set:
-                item = next((p for p in places if p.id == item_id), None)
-            elif item_id in activity_id_set:
-                item = next((a for a in activities if a.id == item_id), None)
-
-            if item and item_id not in item_ids_added:
-                item_dict = {
-                    "id": item.id,
-                    "name": item.name,
-                    "category": item.category,
-                    "description": item.description or "",
-                    "features": item.features,
-                    "score": 1.0,
-                }
-
-                if hasattr(item, "location"):
-                    item_dict["location"] = item.location
-                    item_dict["type"] = "place"
-                else:
-                    item_dict["placeId"] = item.place_id
-                    item_dict["type"] = "activity"
-
-                result_items.append(item_dict)
-                item_ids_added.add(item_id)
+    user = db.get_user(request.userId)
+    if not user:
+        return {"items": []}
 
-        for item, score in high_confidence_items:
-            if item.id in item_ids_added:
-                continue
-
-            item_dict = {
-                "id": item.id,
-                "name": item.name,
-                "category": item.category,
-                "description": item.description or "",
-                "features": item.features,
-                "score": float(score),
-            }
+    interactions, (places_by_id, activities_by_id) = await asyncio.gather(
+        run_in_threadpool(_destination_interactions, request.userId, request.destination),
+        run_in_threadpool(_dest_items_by_id, request.destination),
+    )
 
-            if hasattr(item, "location"):
-                item_dict["location"] = item.location
-                item_dict["type"] = "place"
-            else:
-                item_dict["placeId"] = item.place_id
-                item_dict["type"] = "activity"
+    # Recommendations are drawn from this destination, so its interactions
+    # are the only ones that can exclude or resurface an item
+    liked_item_ids = {inter.item_id for inter in interactions if inter.rating == 1}
+    user_item_ids = {inter.item_id for inter in interactions}
 
-            result_items.append(item_dict)
-            item_ids_added.add(item.id)
+    recommendations = await run_in_threadpool(
+        _cached_recommendations, user, request.destination, 100
+    )
+    # Engine results are sorted by score, so the >= 0.8 ones are a prefix
+    high_confidence_items = [
+        (item, score)
+        for item, score in takewhile(lambda rec: rec[1] >= 0.8, recommendations)
+        if item.id not in user_item_ids
+    ]
+
+    liked_items = (
+        places_by_id.get(item_id) or activities_by_id.get(item_id)
+        for item_id in liked_item_ids
+    )
+    result_items = [_serialize_item(item, 1.0) for item in liked_items if item]
+    # Liked ids are a subset of user_item_ids, which the high-confidence
+    # picks already exclude, so the two lists can't overlap
+    result_items += [_serialize_item(item, score) for item, score in high_confidence_items]
 
-        return {"items": result_items}
-
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"items": result_items}
 
 
 @app.post("/api/multi-user-recommendations")
 async def get_multi_user_recommendations(request: MultiUserRecommendationRequest):
     """Get recommendations for a user considering all trip participants."""
-    try:
-        requesting_user = db.get_user(request.userId)
-        if not requesting_user:
-            requesting_user = User(
-                id=request.userId,
-                age=25,
-                preferences=[],
-                travel_history=[request.destination],
-            )
-            db.save_user(requesting_user)
+    requesting_user = await run_in_threadpool(
+        db.ensure_user, request.userId, 25, [], [request.destination]
+    )
 
-        places = db.get_places_by_destination(request.destination)
-        activities = db.get_activities_by_destination(request.destination)
+    num_places, num_activities = await run_in_threadpool(_dest_counts, request.destination)
 
-        if len(places) == 0 and len(activities) == 0:
-            return {"recommendations": []}
+    if num_places == 0 and num_activities == 0:
+        return {"recommendations": []}
 
-        participant_ages = []
-        for pref in request.participantPreferences:
-            if pref.age:
-                participant_ages.append(pref.age)
+    participant_ages = []
+    for pref in request.participantPreferences:
+        if pref.age:
+            participant_ages.append(pref.age)
 
-        _avg_age = participant_ages[0] if participant_ages else requesting_user.age
+    _avg_age = participant_ages[0] if participant_ages else requesting_user.age
 
-        recommendations = engine.get_recommendations(
-            requesting_user, request.destination, request.topN * 2
-        )
+    recommendations = await run_in_threadpool(
+        _cached_recommendations, requesting_user, request.destination, request.topN * 2
+    )
 
-        item_boost: Dict[str, float] = {}
-        for pref in request.participantPreferences:
-            for item_id in pref.likedItems:
-                item_boost[item_id] = item_boost.get(item_id, 0.0) + 0.1
+    rec_items = [item for item, _ in recommendations]
+    scores = np.fromiter(
+        (score for _, score in recommendations), dtype=np.float64, count=len(recommendations)
+    )
+    like_counts = Counter(
+        item_id for pref in request.participantPreferences for item_id in pref.likedItems
+    )
+
+    # +0.1 per participant like, capped at +50%
+    boosts = np.fromiter(
+        (like_counts.get(item.id, 0) for item in rec_items), dtype=np.float64, count=len(rec_items)
+    )
+    boosts *= 0.1
+    np.minimum(boosts, 0.5, out=boosts)
+    scores *= 1.0 + boosts
 
-        boosted_recommendations = []
-        for item, score in recommendations:
-            boost = min(item_boost.get(item.id, 0.0), 0.5)
-            boosted_recommendations.append((item, score * (1.0 + boost)))
+    order = _top_k_indices(scores, request.topN)
+    result = [_serialize_item(rec_items[i], scores[i]) for i in order]
 
-        boosted_recommendations.sort(key=lambda x: x[1], reverse=True)
+    return {"recommendations": result}
 
-        result = []
-        for item, score in boosted_recommendations[:request.topN]:
-            item_dict = {
-                "id": item.id,
-                "name": item.name,
-                "category": item.category,
-                "description": item.description or "",
-                "features": item.features,
-                "score": float(score),
-            }
 
-            if hasattr(item, "location"):
-                item_dict["location"] = item.location
-                item_dict["type"] = "place"
-            else:
-                item_dict["placeId"] = item.place_id
-                item_dict["type"] = "activity"
+def _participants_confidence(participant_ids: List[str], destination_item_ids: frozenset) -> List[Dict[str, Any]]:
+    """Confidence metrics for every trip participant from two batched DB reads."""
+    users = db.get_users_by_ids(participant_ids)
+    interactions_by_user = db.get_interactions_for_users(list(users), destination_item_ids)
 
-            result.append(item_dict)
+    results = []
+    for participant_id in participant_ids:
+        # Unknown participants have no interactions and report all zeros
+        likes, dislikes = _tally_ratings(interactions_by_user.get(participant_id, ()))
+        total = likes + dislikes
 
-        return {"recommendations": result}
+        confidence_ratio = (likes / total) if total > 0 else 0.0
+        meets_threshold = likes >= 20 and confidence_ratio >= 0.95
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        results.append({
+            "userId": participant_id,
+            "likes": likes,
+            "dislikes": dislikes,
+            "total": total,
+            "confidenceRatio": confidence_ratio,
+            "meetsThreshold": meets_threshold,
+        })
+    return results
 
 
 @app.post("/api/multi-user-confidence-check")
 async def check_multi_user_confidence(request: MultiUserConfidenceCheckRequest):
     """Check confidence metrics for all participants - all must reach 95%."""
-    try:
-        places = db.get_places_by_destination(request.destination)
-        activities = db.get_activities_by_destination(request.destination)
-        destination_item_ids = {p.id for p in places} | {a.id for a in activities}
-
-        participant_results = []
-        all_ready = True
-
-        for participant_id in request.participantIds:
-            user = db.get_user(participant_id)
-
-            if not user:
-                participant_results.append(
-                    {
-                        "userId": participant_id,
-                        "likes": 0,
-                        "dislikes": 0,
-                        "total": 0,
-                        "confidenceRatio": 0.0,
-                        "meetsThreshold": False,
-                    }
-                )
-                all_ready = False
-                continue
-
-            all_interactions = db.get_user_interactions(participant_id)
-
-            destination_interactions = [
-                inter for inter in all_interactions
-                if inter.item_id in destination_item_ids
-            ]
-
-            likes = sum(1 for inter in destination_interactions if inter.rating == 1)
-            dislikes = sum(1 for inter in destination_interactions if inter.rating == -1)
-            total = likes + dislikes
-
-            confidence_ratio = (likes / total) if total > 0 else 0.0
-            meets_threshold = likes >= 20 and confidence_ratio >= 0.95
-
-            participant_results.append(
-                {
-                    "userId": participant_id,
-                    "likes": likes,
-                    "dislikes": dislikes,
-                    "total": total,
-                    "confidenceRatio": confidence_ratio,
-                    "meetsThreshold": meets_threshold,
-                }
-            )
+    destination_item_ids = await asyncio.to_thread(_dest_item_ids, request.destination)
 
-            if not meets_threshold:
-                all_ready = False
-
-        return {"allReady": all_ready, "participants": participant_results}
+    participant_results = await asyncio.to_thread(
+        _participants_confidence, request.participantIds, destination_item_ids
+    )
+    all_ready = all(r["meetsThreshold"] for r in participant_results)
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"allReady": all_ready, "participants": participant_results}
 
 
 @app.post("/api/scrape-image")
 async def scrape_image(request: Dict[str, Any]):
     """Scrape images for a search query."""
-    try:
-        query = request.get("query", "")
-        if not query:
-            raise HTTPException(status_code=400, detail="Query parameter required")
-
-        generator = ActivityGenerator()
+    query = request.get("query", "")
+    if not query:
+        raise HTTPException(status_code=400, detail="Query parameter required")
+
+    generator = ActivityGenerator()
+    fetchers = (
+        generator._get_pexels_image,
+        generator._get_google_image,
+        generator._get_duckduckgo_image,
+        generator._get_unsplash_image,
+    )
 
-        image_url = generator._get_pexels_image(query)
-        if not image_url:
-            image_url = generator._get_google_image(query)
-        if not image_url:
-            image_url = generator._get_duckduckgo_image(query)
-        if not image_url:
-            image_url = generator._get_unsplash_image(query)
+    # Query every source at once and answer with the first image found
+    tasks = [asyncio.create_task(asyncio.to_thread(fetch, query)) for fetch in fetchers]
+    image_url = ""
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            image_url = await next_done
+            if image_url:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
 
-        return {"image_url": image_url}
-
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"image_url": image_url}
 
 
 # -----------------------------------------------------------------------------
@@ -814,16 +1033,12 @@ async def finger_track(
     if not tracker:
         raise HTTPException(status_code=500, detail="Tracker not initialized")
 
-    try:
-        if consume == 1:
-            ok = tracker.consume_swipe_event(event_id)
-            return JSONResponse({"ok": ok})
-
-        swipe, direction, eid = tracker.get_swipe_event()
-        return JSONResponse({"swipe": swipe, "direction": direction, "event_id": eid})
+    if consume == 1:
+        ok = tracker.consume_swipe_event(event_id)
+        return ORJSONResponse({"ok": ok})
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error getting swipe: {str(e)}")
+    swipe, direction, eid = tracker.get_swipe_event()
+    return ORJSONResponse({"swipe": swipe, "direction": direction, "event_id": eid})
 
 @app.get("/api/view-adjust")
 async def view_adjust_get():
@@ -831,11 +1046,8 @@ async def view_adjust_get():
     global tracker
     if not tracker:
         raise HTTPException(status_code=500, detail="Tracker not initialized")
-    try:
-        x_frac, y_frac = tracker.get_position()
-        return JSONResponse({"x_frac": 1 - x_frac, "y_frac": y_frac})
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error getting position: {str(e)}")
+    x_frac, y_frac = tracker.get_position()
+    return ORJSONResponse({"x_frac": 1 - x_frac, "y_frac": y_frac})
 
 
 @app.get("/api/status")
@@ -843,12 +1055,12 @@ async def get_status():
     """Get tracker status"""
     global tracker
     if not tracker:
-        return JSONResponse({"running": False, "error": "Tracker not initialized"})
+        return ORJSONResponse({"running": False, "error": "Tracker not initialized"})
 
     x_frac, y_frac = tracker.get_position()
     swipe, direction = tracker.get_swipe()
 
-    return JSONResponse(
+    return ORJSONResponse(
         {
             "running": tracker.running,
             "position": {"x": x_frac, "y": y_frac},
@@ -863,4 +1075,17 @@ async def get_status():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # "auto" picks uvloop + httptools when installed (uvicorn[standard]) and falls
+    # back to asyncio + h11 otherwise. Keep a single process: the camera and the
+    # JSON database belong to this one. The gesture routes are polled several
+    # times a second, so keep connections alive longer and skip per-request
+    # access logging.
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        timeout_keep_alive=30,
+        access_log=False,
+    )
\ No newline at end of file
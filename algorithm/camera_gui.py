@@ -5,12 +5,13 @@ Shows camera feed with hand tracking overlay.
 
 import cv2
 import mediapipe as mp
+import queue
 import threading
 import time
 from typing import Optional
 
 class CameraGUI:
-    def __init__(self, cam_index: int = 0):
+    def __init__(self, cam_index: int = 0, infer_width: int = 320):
         self.cap = cv2.VideoCapture(cam_index)
         if not self.cap.isOpened():
             raise RuntimeError("Failed to open camera")
@@ -19,14 +20,20 @@ class CameraGUI:
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
             max_num_hands=1,
-            model_complexity=1,
-            min_detection_confidence=0.75,
-            min_tracking_confidence=0.75,
+            model_complexity=0,               # speed change
+            min_detection_confidence=0.60,    # speed change (less strict)
+            min_tracking_confidence=0.60,     # speed change (less strict)
         )
+        # MediaPipe sees a downscaled copy; its landmarks are normalized, so
+        # they still draw correctly on the full-size display frame
+        self.infer_width = infer_width
         self.mp_drawing = mp.solutions.drawing_utils
 
         self.running = False
         self.thread: Optional[threading.Thread] = None
+        self.capture_thread: Optional[threading.Thread] = None
+        # Newest camera frame only; if MediaPipe falls behind, stale frames are dropped
+        self._frames: queue.Queue = queue.Queue(maxsize=1)
 
     def run(self):
         """Run the camera GUI in a separate thread."""
@@ -34,27 +41,57 @@ class CameraGUI:
             return
         
         self.running = True
+        self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self.capture_thread.start()
         self.thread = threading.Thread(target=self._camera_loop, daemon=True)
         self.thread.start()
         print("Camera GUI started")
 
+    def _capture_loop(self):
+        """Read camera frames and keep only the latest one for the display loop."""
+        try:
+            while self.running:
+                ret, frame = self.cap.read()
+                if not ret or frame is None:
+                    self.running = False
+                    break
+
+                try:
+                    self._frames.put_nowait(frame)
+                except queue.Full:
+                    try:
+                        self._frames.get_nowait()
+                    except queue.Empty:
+                        pass
+                    self._frames.put_nowait(frame)
+        finally:
+            # Released here, not in stop(), so it never happens mid-read
+            self.cap.release()
+
     def _camera_loop(self):
         """Main camera loop."""
         cv2.namedWindow("Finger Tracking Camera", cv2.WINDOW_NORMAL)
         cv2.resizeWindow("Finger Tracking Camera", 640, 480)
 
         while self.running:
-            ret, frame = self.cap.read()
-            if not ret or frame is None:
-                break
+            try:
+                frame = self._frames.get(timeout=0.5)
+            except queue.Empty:
+                continue
 
             frame = cv2.flip(frame, 1)
             h, w = frame.shape[:2]
 
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            rgb.flags.writeable = False
+            if w > self.infer_width:
+                small = cv2.resize(
+                    frame,
+                    (self.infer_width, round(h * self.infer_width / w)),
+                    interpolation=cv2.INTER_AREA,
+                )
+            else:
+                small = frame
+            rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
             results = self.hands.process(rgb)
-            rgb.flags.writeable = True
 
             if results.multi_hand_landmarks:
                 for hand_landmarks in results.multi_hand_landmarks:
@@ -91,16 +128,18 @@ class CameraGUI:
                 self.stop()
                 break
 
-            time.sleep(0.033)
-
         cv2.destroyAllWindows()
 
     def stop(self):
         """Stop the camera GUI."""
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=2.0)
-        self.cap.release()
+        # stop() also runs on the display thread when 'q' is pressed
+        for thread in (self.capture_thread, self.thread):
+            if thread and thread is not threading.current_thread():
+                thread.join(timeout=2.0)
+        if self.capture_thread is None:
+            # Never started; otherwise the capture thread releases it on exit
+            self.cap.release()
         self.hands.close()
         print("Camera GUI stopped")
 
@@ -1,6 +1,8 @@
 """Collaborative filtering recommendation engine."""
+import heapq
+from operator import itemgetter
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from models import User, Place, Activity, Interaction
 from database import Database
 
@@ -12,56 +14,112 @@ class CollaborativeFilter:
         """Initialize collaborative filter with database."""
         self.db = db
     
-    def calculate_user_similarity(self, user1: User, user2: User) -> float:
+    def calculate_user_similarity(
+        self,
+        user1: User,
+        user2: User,
+        interactions_by_user: Optional[Dict[str, List[Interaction]]] = None
+    ) -> float:
         """
         Calculate cosine similarity between two users based on their interactions.
         
+        Pass interactions_by_user (from db.get_interactions_grouped) when scoring
+        many pairs so each user's interactions are read once, not once per pair.
+        
+        Ratings are always +1 or -1 (a swipe), so over the common items the
+        dot product is agreements minus disagreements and each vector's
+        squared norm is the number of common items; the cosine reduces to
+        integer counting.
+        
         Returns similarity score between 0 and 1.
         """
-        interactions1 = self.db.get_user_interactions(user1.id)
-        interactions2 = self.db.get_user_interactions(user2.id)
+        if interactions_by_user is None:
+            interactions1 = self.db.get_user_interactions(user1.id)
+            interactions2 = self.db.get_user_interactions(user2.id)
+        else:
+            interactions1 = interactions_by_user.get(user1.id, [])
+            interactions2 = interactions_by_user.get(user2.id, [])
         
         # Create item rating vectors
         items1 = {inter.item_id: inter.rating for inter in interactions1}
         items2 = {inter.item_id: inter.rating for inter in interactions2}
         
         # Find common items
-        common_items = set(items1.keys()) & set(items2.keys())
+        common_items = items1.keys() & items2.keys()
         
         if len(common_items) == 0:
             return 0.0
         
-        # Build vectors for common items
-        vec1 = np.array([items1[item] for item in common_items])
-        vec2 = np.array([items2[item] for item in common_items])
-        
-        # Calculate cosine similarity
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
-        
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        
-        similarity = dot_product / (norm1 * norm2)
+        # Cosine similarity of two +/-1 vectors: (agree - disagree) / |common|
+        agreement = sum(items1[item] * items2[item] for item in common_items)
+        similarity = agreement / len(common_items)
         return max(0.0, similarity)  # Ensure non-negative
     
-    def find_similar_users(self, target_user: User, top_k: int = 10) -> List[Tuple[User, float]]:
-        """Find top K most similar users."""
-        all_users = self.db.get_all_users()
-        similarities = []
+    def find_similar_users(
+        self,
+        target_user: User,
+        top_k: int = 10,
+        interactions_by_user: Optional[Dict[str, List[Interaction]]] = None
+    ) -> List[Tuple[User, float]]:
+        """
+        Find top K most similar users.
         
-        for user in all_users:
+        Scores every user against the target in one vectorized pass. Only
+        items the target rated can be in common, so each user's ratings are
+        reduced to (row, target column, rating) triples, and the per-user
+        agreement sum and common-item count of calculate_user_similarity
+        become two np.bincount passes over those triples.
+        """
+        if interactions_by_user is None:
+            interactions_by_user = self.db.get_interactions_grouped()
+        
+        # Latest rating per item wins, as in calculate_user_similarity
+        target_ratings = {
+            inter.item_id: inter.rating
+            for inter in interactions_by_user.get(target_user.id, [])
+        }
+        if not target_ratings:
+            return []
+        target_col = {item_id: j for j, item_id in enumerate(target_ratings)}
+        target_vec = np.fromiter(target_ratings.values(), dtype=np.float64, count=len(target_ratings))
+        
+        candidates: List[User] = []
+        rows: List[int] = []
+        cols: List[int] = []
+        ratings: List[float] = []
+        
+        for user in self.db.get_all_users():
             if user.id == target_user.id:
                 continue
             
-            similarity = self.calculate_user_similarity(target_user, user)
-            if similarity > 0:
-                similarities.append((user, similarity))
-        
-        # Sort by similarity descending
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:top_k]
+            user_ratings = {inter.item_id: inter.rating for inter in interactions_by_user.get(user.id, [])}
+            common = [(target_col[item_id], rating) for item_id, rating in user_ratings.items() if item_id in target_col]
+            if not common:
+                continue
+            
+            row = len(candidates)
+            candidates.append(user)
+            for col, rating in common:
+                rows.append(row)
+                cols.append(col)
+                ratings.append(rating)
+        
+        if not candidates:
+            return []
+        
+        n = len(candidates)
+        row_arr = np.array(rows, dtype=np.intp)
+        rating_arr = np.array(ratings, dtype=np.float64)
+        target_arr = target_vec[np.array(cols, dtype=np.intp)]
+        
+        # Every candidate shares at least one item, so the counts are nonzero
+        agreement = np.bincount(row_arr, weights=rating_arr * target_arr, minlength=n)
+        similarities = agreement / np.bincount(row_arr, minlength=n)
+        
+        # Sort by similarity descending (stable, so ties keep user order)
+        positive = np.flatnonzero(similarities > 0)
+        top = positive[np.argsort(-similarities[positive], kind="stable")[:top_k]]
+        return [(candidates[i], float(similarities[i])) for i in top]
     
     def get_recommendations(
         self, 
@@ -75,20 +133,23 @@ class CollaborativeFilter:
         
         Returns dictionary mapping item_id to recommendation score.
         """
-        similar_users = self.find_similar_users(target_user)
+        # One read of all interactions serves the similarity pass and the
+        # neighbour lookups below
+        interactions_by_user = self.db.get_interactions_grouped()
+        similar_users = self.find_similar_users(target_user, interactions_by_user=interactions_by_user)
         
         if len(similar_users) == 0:
             return {}
         
         # Get items user hasn't interacted with
-        user_interactions = self.db.get_user_interactions(target_user.id)
+        user_interactions = interactions_by_user.get(target_user.id, [])
         user_item_ids = {inter.item_id for inter in user_interactions}
         
         # Collect recommendations from similar users
         item_scores: Dict[str, float] = {}
         
         for similar_user, similarity in similar_users:
-            similar_interactions = self.db.get_user_interactions(similar_user.id)
+            similar_interactions = interactions_by_user.get(similar_user.id, [])
             
             for inter in similar_interactions:
                 if inter.item_id not in user_item_ids and inter.rating > 0:
@@ -109,6 +170,5 @@ class CollaborativeFilter:
         item_scores = {k: v for k, v in item_scores.items() if k in valid_item_ids}
         
         # Return top N
-        sorted_items = sorted(item_scores.items(), key=lambda x: x[1], reverse=True)
-        return dict(sorted_items[:top_n])
+        return dict(heapq.nlargest(top_n, item_scores.items(), key=itemgetter(1)))
 
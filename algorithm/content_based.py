@@ -38,12 +38,11 @@ class ContentBasedFilter:
             if item is None:
                 continue
             
-            # Extract features
-            features = item.features
-            category = item.category.lower()
-            energy_level = features.get("energy_level", "medium").lower()
-            tags = features.get("tags", [])
-            age_suitability = features.get("age_suitability_profile", "").lower()
+            # Extract features (lowercased once when the item was loaded)
+            category = item._cat_l
+            energy_level = item._energy
+            tags = item.features.get("tags", [])
+            age_suitability = item._age_suit
             
             # Weight features by rating
             weight = inter.rating
@@ -84,11 +83,10 @@ class ContentBasedFilter:
         if not user_preferences:
             return 0.5  # Default neutral score
         
-        features = item.features
-        category = item.category.lower()
-        energy_level = features.get("energy_level", "medium").lower()
-        tags = features.get("tags", [])
-        age_suitability = features.get("age_suitability_profile", "").lower()
+        category = item._cat_l
+        energy_level = item._energy
+        tags = item.features.get("tags", [])
+        age_suitability = item._age_suit
         
         score = 0.0
         matches = 0
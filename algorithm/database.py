@@ -1,7 +1,10 @@
 """Database interface for MongoDB only."""
 import json
 import os
-from typing import List, Optional, Dict, Any
+import threading
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Set, Tuple
+import numpy as np
 from models import User, Place, Activity, Interaction
 
 try:
@@ -12,6 +15,25 @@ except ImportError:
     MONGODB_AVAILABLE = False
 
 
+@dataclass
+class DestinationItems:
+    """Struct-of-arrays view over all places and activities in a destination."""
+    places: List[Place]
+    activities: List[Activity]
+    items: List[Place | Activity]  # places followed by activities
+    item_ids: np.ndarray  # object[N]
+    cat_class: np.ndarray  # uint8[N], age-scoring category class per item
+    index: Dict[str, int]  # item id -> position in items
+
+
+def _index_by_id(rows: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Map each row id to the position of its first occurrence."""
+    index: Dict[str, int] = {}
+    for i, row in enumerate(rows):
+        index.setdefault(row["id"], i)
+    return index
+
+
 class Database:
     """Database interface supporting MongoDB only."""
     
@@ -22,6 +44,9 @@ class Database:
             script_dir = os.path.dirname(os.path.abspath(__file__))
             db_path = os.path.join(script_dir, "data", "new_db.json")
         self.db_path = db_path
+        # API handlers call into the database from worker threads
+        self._write_lock = threading.Lock()
+        self._user_lock = threading.Lock()
         self._ensure_data_dir()
         self._load_db()
     
@@ -76,18 +101,37 @@ class Database:
                 "interactions": []
             }
             self._save_db()
+        
+        # id -> position in the JSON lists, so by-id reads and upserts are O(1)
+        self._user_index = _index_by_id(self.db["users"])
+        self._place_index = _index_by_id(self.db["places"])
+        self._activity_index = _index_by_id(self.db["activities"])
+        
+        # user_id -> their interaction rows (in insertion order) and the
+        # timestamp of their most recent one
+        self._interactions_by_user: Dict[str, List[Dict[str, Any]]] = {}
+        self._latest_interaction_ts: Dict[str, str] = {}
+        # Bumped on every new interaction; anything derived from the whole
+        # interaction set (e.g. collaborative scores) is stale once it moves
+        self._interaction_version = 0
+        for interaction_data in self.db["interactions"]:
+            user_id = interaction_data["user_id"]
+            self._interactions_by_user.setdefault(user_id, []).append(interaction_data)
+            self._latest_interaction_ts[user_id] = interaction_data["timestamp"]
     
     def _save_db(self):
         """Save database to JSON file."""
-        with open(self.db_path, 'w') as f:
+        with self._write_lock, open(self.db_path, 'w') as f:
             json.dump(self.db, f, indent=2)
     
+    def save(self):
+        """Write the current in-memory state to the JSON file."""
+        self._save_db()
+    
     def get_user(self, user_id: str) -> Optional[User]:
         """Get user by ID."""
-        for user_data in self.db["users"]:
-            if user_data["id"] == user_id:
-                return User(**user_data)
-        return None
+        i = self._user_index.get(user_id)
+        return User(**self.db["users"][i]) if i is not None else None
     
     def _get_places_from_mongodb(self, destination: str) -> List[Place]:
         """Get places from MongoDB by destination."""
@@ -190,17 +234,40 @@ class Database:
     
     def get_activities_by_destination(self, destination: str) -> List[Activity]:
         """Get all activities in places within a destination from JSON only."""
+        return self.get_items_by_destination(destination)[1]
+    
+    def get_items_by_destination(self, destination: str) -> Tuple[List[Place], List[Activity]]:
+        """Get (places, activities) in a destination, resolving the places only once."""
         places = self.get_places_by_destination(destination)
         place_ids = {place.id for place in places}
         
         if not place_ids:
-            return []
+            return places, []
         
-        return [
+        activities = [
             Activity(**activity_data)
             for activity_data in self.db["activities"]
             if activity_data.get("place_id") in place_ids
         ]
+        return places, activities
+    
+    def get_destination_items(self, destination: str) -> DestinationItems:
+        """Get all places and activities in a destination as a DestinationItems."""
+        places, activities = self.get_items_by_destination(destination)
+        items: List[Place | Activity] = [*places, *activities]
+
+        index: Dict[str, int] = {}
+        for i, item in enumerate(items):
+            index.setdefault(item.id, i)  # places win on id clashes
+
+        return DestinationItems(
+            places=places,
+            activities=activities,
+            items=items,
+            item_ids=np.array([item.id for item in items], dtype=object),
+            cat_class=np.fromiter((item._cat_class for item in items), dtype=np.uint8, count=len(items)),
+            index=index,
+        )
     
     def save_places(self, places: List[Place]):
         """Save places to JSON file only."""
@@ -215,15 +282,12 @@ class Database:
             }
             
             # Check if place already exists in JSON
-            existing_index = None
-            for i, existing_place in enumerate(self.db["places"]):
-                if existing_place["id"] == place.id:
-                    existing_index = i
-                    break
+            existing_index = self._place_index.get(place.id)
             
             if existing_index is not None:
                 self.db["places"][existing_index] = place_dict
             else:
+                self._place_index[place.id] = len(self.db["places"])
                 self.db["places"].append(place_dict)
         
         self._save_db()
@@ -242,32 +306,69 @@ class Database:
             }
             
             # Check if activity already exists in JSON
-            existing_index = None
-            for i, existing_activity in enumerate(self.db["activities"]):
-                if existing_activity["id"] == activity.id:
-                    existing_index = i
-                    break
+            existing_index = self._activity_index.get(activity.id)
             
             if existing_index is not None:
                 self.db["activities"][existing_index] = activity_dict
             else:
+                self._activity_index[activity.id] = len(self.db["activities"])
                 self.db["activities"].append(activity_dict)
         
         self._save_db()
         print(f"Saved {len(activities)} activities to new_db.json")
     
+    def get_users_by_ids(self, user_ids: List[str]) -> Dict[str, User]:
+        """Get the users that exist among the given ids, keyed by id."""
+        users = self.db["users"]
+        return {
+            user_id: User(**users[i])
+            for user_id in user_ids
+            if (i := self._user_index.get(user_id)) is not None
+        }
+    
     def get_user_interactions(self, user_id: str) -> List[Interaction]:
         """Get all interactions for a user."""
         return [
             Interaction(**interaction_data)
-            for interaction_data in self.db["interactions"]
-            if interaction_data["user_id"] == user_id
+            for interaction_data in self._interactions_by_user.get(user_id, ())
         ]
     
+    def get_user_interactions_for_items(self, user_id: str, item_ids: Set[str]) -> List[Interaction]:
+        """Get a user's interactions with any of the given items (e.g. one destination's)."""
+        return [
+            Interaction(**interaction_data)
+            for interaction_data in self._interactions_by_user.get(user_id, ())
+            if interaction_data["item_id"] in item_ids
+        ]
+    
+    def get_interactions_for_users(
+        self, user_ids: List[str], item_ids: Optional[Set[str]] = None
+    ) -> Dict[str, List[Interaction]]:
+        """Get the interactions of several users at once, keyed by user id.
+        
+        With item_ids, only interactions with those items are returned.
+        """
+        if item_ids is None:
+            return {user_id: self.get_user_interactions(user_id) for user_id in user_ids}
+        return {user_id: self.get_user_interactions_for_items(user_id, item_ids) for user_id in user_ids}
+    
+    def get_interactions_grouped(self) -> Dict[str, List[Interaction]]:
+        """Get every user's interactions in one pass, keyed by user id."""
+        # Snapshot the index first: a first-time swiper's add_interaction can
+        # insert a key from another thread while this runs in a worker
+        return {
+            user_id: [Interaction(**interaction_data) for interaction_data in rows]
+            for user_id, rows in list(self._interactions_by_user.items())
+        }
+    
     def get_all_users(self) -> List[User]:
         """Get all users."""
         return [User(**user_data) for user_data in self.db["users"]]
     
+    def get_destinations(self) -> List[str]:
+        """Get the distinct destinations that have places."""
+        return list({place_data.get("location", "").lower() for place_data in self.db["places"]} - {""})
+    
     def get_all_places(self) -> List[Place]:
         """Get all places."""
         return [Place(**place_data) for place_data in self.db["places"]]
@@ -276,8 +377,12 @@ class Database:
         """Get all activities."""
         return [Activity(**activity_data) for activity_data in self.db["activities"]]
     
-    def add_interaction(self, interaction: Interaction):
-        """Add a new interaction."""
+    def add_interaction(self, interaction: Interaction, persist: bool = True):
+        """Add a new interaction.
+        
+        With persist=False only the in-memory state is updated; call save()
+        later to write it to disk.
+        """
         interaction_dict = {
             "user_id": interaction.user_id,
             "item_id": interaction.item_id,
@@ -286,21 +391,33 @@ class Database:
             "timestamp": interaction.timestamp
         }
         self.db["interactions"].append(interaction_dict)
-        self._save_db()
+        self._interactions_by_user.setdefault(interaction.user_id, []).append(interaction_dict)
+        self._latest_interaction_ts[interaction.user_id] = interaction.timestamp
+        self._interaction_version += 1
+        if persist:
+            self._save_db()
+    
+    def get_interaction_version(self) -> int:
+        """Get a counter that changes whenever any user adds an interaction."""
+        return self._interaction_version
+    
+    def get_user_latest_interaction_ts(self, user_id: str) -> Optional[str]:
+        """Get the timestamp of a user's most recent interaction (None if none)."""
+        return self._latest_interaction_ts.get(user_id)
     
     def get_place_by_id(self, place_id: str) -> Optional[Place]:
         """Get place by ID."""
-        for place_data in self.db["places"]:
-            if place_data["id"] == place_id:
-                return Place(**place_data)
-        return None
+        i = self._place_index.get(place_id)
+        return Place(**self.db["places"][i]) if i is not None else None
     
     def get_activity_by_id(self, activity_id: str) -> Optional[Activity]:
         """Get activity by ID."""
-        for activity_data in self.db["activities"]:
-            if activity_data["id"] == activity_id:
-                return Activity(**activity_data)
-        return None
+        i = self._activity_index.get(activity_id)
+        return Activity(**self.db["activities"][i]) if i is not None else None
+    
+    def get_item_type(self, item_id: str) -> str:
+        """Get "place" if the id is a known place, otherwise "activity"."""
+        return "place" if item_id in self._place_index else "activity"
     
     def save_user(self, user: User):
         """Save or update a user in the database."""
@@ -312,18 +429,33 @@ class Database:
         }
         
         # Check if user exists
-        user_index = None
-        for i, existing_user in enumerate(self.db["users"]):
-            if existing_user["id"] == user.id:
-                user_index = i
-                break
+        user_index = self._user_index.get(user.id)
         
         if user_index is not None:
             # Update existing user
             self.db["users"][user_index] = user_dict
         else:
             # Add new user
+            self._user_index[user.id] = len(self.db["users"])
             self.db["users"].append(user_dict)
         
         self._save_db()
-
+    
+    def ensure_user(self, user_id: str, age: int, preferences: List[str],
+                    travel_history: List[str]) -> User:
+        """Get a user, creating it with the given defaults if it doesn't exist."""
+        with self._user_lock:
+            i = self._user_index.get(user_id)
+            if i is not None:
+                return User(**self.db["users"][i])
+            user_dict = {
+                "id": user_id,
+                "age": age,
+                "preferences": preferences,
+                "travel_history": travel_history
+            }
+            self._user_index[user_id] = len(self.db["users"])
+            self.db["users"].append(user_dict)
+        
+        self._save_db()
+        return User(**user_dict)
@@ -17,7 +17,7 @@ def display_item(item, score: float):
     print(f"📍 {item.name}")
     print(f"   Category: {item.category}")
     
-    if hasattr(item, 'location'):
+    if item.kind == "place":
         print(f"   Location: {item.location}")
     
     features = item.features
@@ -88,8 +88,7 @@ def main():
     print_separator()
     
     # Check if destination has any places/activities
-    places = db.get_places_by_destination(destination)
-    activities = db.get_activities_by_destination(destination)
+    places, activities = db.get_items_by_destination(destination)
     
     if len(places) == 0 and len(activities) == 0:
         print(f"Sorry, no recommendations found for {destination}.")
@@ -164,7 +163,7 @@ def main():
                 interaction = Interaction(
                     user_id=user_id,
                     item_id=item.id,
-                    item_type="place" if hasattr(item, 'location') else "activity",
+                    item_type=item.kind,
                     rating=1,
                     timestamp=datetime.now().isoformat()
                 )
@@ -178,7 +177,7 @@ def main():
                 interaction = Interaction(
                     user_id=user_id,
                     item_id=item.id,
-                    item_type="place" if hasattr(item, 'location') else "activity",
+                    item_type=item.kind,
                     rating=-1,
                     timestamp=datetime.now().isoformat()
                 )
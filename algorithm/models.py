@@ -1,9 +1,36 @@
 """Data models for the recommendation system."""
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import ClassVar, List, Optional, Dict, Any
 from datetime import datetime
 
 
+# Age-scoring category classes, in precedence order (see AgeScorer.MULT_TABLE)
+HIGH_ENERGY, LOW_ENERGY, FAMILY, EDUCATIONAL, MEDIUM, OTHER = range(6)
+
+
+def category_class(category: str, energy_level: str, age_suitability: str) -> int:
+    """Classify an item (from its lowercased fields) into an age-scoring category class."""
+    if energy_level == "high" or "nightlife" in age_suitability or "club" in category:
+        return HIGH_ENERGY
+    if energy_level == "low" or "cultural" in age_suitability or "museum" in category:
+        return LOW_ENERGY
+    if "family" in age_suitability or "family-friendly" in category:
+        return FAMILY
+    if "educational" in age_suitability or "educational" in category:
+        return EDUCATIONAL
+    if energy_level == "medium":
+        return MEDIUM
+    return OTHER
+
+
+def _cache_scoring_fields(item):
+    """Cache lowercased scoring fields and the category class on a Place/Activity."""
+    item._energy = item.features.get("energy_level", "medium").lower()
+    item._age_suit = item.features.get("age_suitability_profile", "").lower()
+    item._cat_l = item.category.lower()
+    item._cat_class = category_class(item._cat_l, item._energy, item._age_suit)
+
+
 @dataclass
 class User:
     """User model."""
@@ -16,6 +43,8 @@ class User:
 @dataclass
 class Place:
     """Place model."""
+    kind: ClassVar[str] = "place"  # type tag used for serialization and interactions
+
     id: str
     name: str
     location: str  # Destination/city
@@ -23,10 +52,16 @@ class Place:
     features: Dict[str, Any]  # tags, price_range, energy_level, age_suitability_profile
     description: Optional[str] = None
 
+    def __post_init__(self):
+        """Precompute lowercased scoring fields once at load time."""
+        _cache_scoring_fields(self)
+
 
 @dataclass
 class Activity:
     """Activity model."""
+    kind: ClassVar[str] = "activity"
+
     id: str
     name: str
     place_id: str
@@ -34,6 +69,10 @@ class Activity:
     features: Dict[str, Any]  # tags, energy_level, age_suitability_profile
     description: Optional[str] = None
 
+    def __post_init__(self):
+        """Precompute lowercased scoring fields once at load time."""
+        _cache_scoring_fields(self)
+
 
 @dataclass
 class Interaction:
@@ -190,6 +190,8 @@ class PineconeService:
         
         # Build query from user's positive interactions
         liked_items = [inter for inter in user_interactions if inter.rating > 0]
+        places_by_id = {p.id: p for p in places}
+        activities_by_id = {a.id: a for a in activities}
         
         if len(liked_items) == 0:
             # Use destination as query
@@ -199,9 +201,9 @@ class PineconeService:
             query_parts = []
             for inter in liked_items[:5]:  # Use top 5 liked items
                 if inter.item_type == "place":
-                    item = next((p for p in places if p.id == inter.item_id), None)
+                    item = places_by_id.get(inter.item_id)
                 else:
-                    item = next((a for a in activities if a.id == inter.item_id), None)
+                    item = activities_by_id.get(inter.item_id)
                 
                 if item:
                     query_parts.append(self._get_item_text(item))
@@ -212,8 +214,10 @@ class PineconeService:
         similar_items = self.get_similar_items(query_text, user_interactions, top_n * 2)
         
         # Filter to only include items in destination
-        valid_item_ids = {p.id for p in places} | {a.id for a in activities}
-        similar_items = {k: v for k, v in similar_items.items() if k in valid_item_ids}
+        similar_items = {
+            k: v for k, v in similar_items.items()
+            if k in places_by_id or k in activities_by_id
+        }
         
         # Return top N
         sorted_items = sorted(similar_items.items(), key=lambda x: x[1], reverse=True)
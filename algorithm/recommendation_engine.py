@@ -1,5 +1,6 @@
 """Main recommendation engine orchestrating hybrid approach."""
-from typing import List, Dict, Tuple
+from typing import List, Tuple
+import numpy as np
 from models import User, Place, Activity
 from database import Database
 from collaborative_filter import CollaborativeFilter
@@ -31,8 +32,8 @@ class RecommendationEngine:
         Returns list of (item, final_score) tuples sorted by score descending.
         """
         # Get items in destination
-        places = self.db.get_places_by_destination(destination)
-        activities = self.db.get_activities_by_destination(destination)
+        dest = self.db.get_destination_items(destination)
+        places, activities = dest.places, dest.activities
         
         if len(places) == 0 and len(activities) == 0:
             return []
@@ -58,50 +59,31 @@ class RecommendationEngine:
         # collab: 0.4, content: 0.3, pinecone: 0.3
         all_item_ids = set(collab_scores.keys()) | set(content_scores.keys()) | set(pinecone_scores.keys())
         
-        combined_scores: Dict[str, float] = {}
+        positions: List[int] = []
+        base_scores: List[float] = []
         
         for item_id in all_item_ids:
+            position = dest.index.get(item_id)
+            if position is None:
+                continue
+            
             collab_score = collab_scores.get(item_id, 0.0)
             content_score = content_scores.get(item_id, 0.0)
             pinecone_score = pinecone_scores.get(item_id, 0.0)
             
             # Weighted combination
-            base_score = (
+            positions.append(position)
+            base_scores.append(
                 collab_score * 0.4 +
                 content_score * 0.3 +
                 pinecone_score * 0.3
             )
-            
-            # Apply age suitability multiplier
-            item = None
-            if item_id in {p.id for p in places}:
-                item = next((p for p in places if p.id == item_id), None)
-            elif item_id in {a.id for a in activities}:
-                item = next((a for a in activities if a.id == item_id), None)
-            
-            if item:
-                if isinstance(item, Place):
-                    age_multiplier = self.age_scorer.get_multiplier_for_place(user.age, item)
-                else:
-                    age_multiplier = self.age_scorer.get_multiplier_for_activity(user.age, item)
-                
-                final_score = base_score * age_multiplier
-                combined_scores[item_id] = final_score
         
-        # Sort by final score
-        sorted_items = sorted(combined_scores.items(), key=lambda x: x[1], reverse=True)
+        # Apply age suitability multipliers to all items in one lookup
+        position_arr = np.array(positions, dtype=np.intp)
+        final_scores = np.array(base_scores, dtype=np.float64)
+        final_scores *= self.age_scorer.multipliers(user.age, dest.cat_class[position_arr])
         
-        # Convert to (item, score) tuples
-        results = []
-        for item_id, score in sorted_items[:top_n]:
-            item = None
-            if item_id in {p.id for p in places}:
-                item = next((p for p in places if p.id == item_id), None)
-            elif item_id in {a.id for a in activities}:
-                item = next((a for a in activities if a.id == item_id), None)
-            
-            if item:
-                results.append((item, score))
-        
-        return results
-
+        # Sort by final score and convert to (item, score) tuples
+        order = np.argsort(-final_scores, kind="stable")[:top_n]
+        return [(dest.items[position_arr[i]], float(final_scores[i])) for i in order]
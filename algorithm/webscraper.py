@@ -2,13 +2,106 @@
 import os
 import json
 import pickle
+import re
+import threading
 import time
+import urllib.parse
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from models import Place, Activity
 
+# One pooled session for Gemini and the image searches so repeat calls to the
+# same host reuse the TCP/TLS connection instead of handshaking every time
+_http = requests.Session()
+# Pool sized for the image-lookup workers; transient connect errors and
+# gateway failures get two quick retries instead of failing the lookup
+_http_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+)
+_http.mount("https://", _http_adapter)
+_http.mount("http://", _http_adapter)
+
+# Body of a markdown code fence (```json ... ``` or ``` ... ```) in a model reply
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.S)
+
+# Fallback activity templates ({location} is filled in per call)
+_FALLBACK_TEMPLATES: Tuple[Dict[str, Any], ...] = (
+    {"name": "Historic {location} Walking Tour", "description": "Popular tour attraction in {location}", "category": "Tour", "tags": ("walking", "history", "cultural"), "energy": "medium", "age": "cultural", "budget": "$25"},
+    {"name": "{location} City Museum", "description": "Popular museum attraction in {location}", "category": "Museum", "tags": ("indoor", "art", "history"), "energy": "low", "age": "educational", "budget": "$15"},
+    {"name": "Central {location} Park", "description": "Popular park attraction in {location}", "category": "Park", "tags": ("outdoor", "relaxing", "nature"), "energy": "low", "age": "family-friendly", "budget": "free"},
+    {"name": "{location} Main Cathedral", "description": "Popular temple attraction in {location}", "category": "Temple", "tags": ("architecture", "spiritual", "historic"), "energy": "low", "age": "cultural", "budget": "free"},
+    {"name": "Local {location} Market", "description": "Popular attraction attraction in {location}", "category": "Attraction", "tags": ("shopping", "food", "local"), "energy": "medium", "age": "cultural", "budget": "$20"},
+    {"name": "Traditional {location} Restaurant", "description": "Popular restaurant attraction in {location}", "category": "Restaurant", "tags": ("dining", "authentic", "food"), "energy": "low", "age": "cultural", "budget": "$40"},
+    {"name": "{location} Art Gallery", "description": "Popular museum attraction in {location}", "category": "Museum", "tags": ("art", "indoor", "cultural"), "energy": "low", "age": "educational", "budget": "$12"},
+    {"name": "{location} Riverfront Cruise", "description": "Popular tour attraction in {location}", "category": "Tour", "tags": ("scenic", "relaxing", "water"), "energy": "low", "age": "family-friendly", "budget": "$35"},
+    {"name": "{location} Night Entertainment", "description": "Popular entertainment attraction in {location}", "category": "Entertainment", "tags": ("nightlife", "music", "social"), "energy": "high", "age": "nightlife", "budget": "$50"},
+    {"name": "{location} Viewpoint Tower", "description": "Popular landmark attraction in {location}", "category": "Landmark", "tags": ("scenic", "views", "iconic"), "energy": "medium", "age": "cultural", "budget": "$18"},
+)
+
+# In-process layer over the pickle cache: location -> (expires_at, items),
+# LRU-bounded to _MEMORY_CACHE_MAXSIZE locations
+_MEMORY_CACHE_MAXSIZE = 64
+_MEMORY_CACHE: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+_MEMORY_CACHE_LOCK = threading.Lock()
+
+
+def _memory_cache_get(location: str) -> Optional[List[Dict[str, Any]]]:
+    """Get unexpired cached items for a location, dropping the entry if expired."""
+    with _MEMORY_CACHE_LOCK:
+        cached = _MEMORY_CACHE.get(location)
+        if cached is None:
+            return None
+        if time.time() >= cached[0]:
+            del _MEMORY_CACHE[location]
+            return None
+        _MEMORY_CACHE.move_to_end(location)
+        return cached[1]
+
+
+def _memory_cache_put(location: str, expires_at: float, items: List[Dict[str, Any]]):
+    """Cache items for a location, evicting the least recently used beyond the cap."""
+    with _MEMORY_CACHE_LOCK:
+        _MEMORY_CACHE[location] = (expires_at, items)
+        _MEMORY_CACHE.move_to_end(location)
+        if len(_MEMORY_CACHE) > _MEMORY_CACHE_MAXSIZE:
+            _MEMORY_CACHE.popitem(last=False)
+
+
+# One lock per location so concurrent requests for an unseen destination make
+# a single Gemini call; the rest wait and then read what it saved.
+# location -> [lock, number of threads holding or waiting on it]; an entry is
+# removed when its count drops to zero, so client-supplied names don't pile up
+_SCRAPE_LOCKS: Dict[str, List[Any]] = {}
+_SCRAPE_LOCKS_GUARD = threading.Lock()
+
+
+@contextmanager
+def _scrape_lock(location: str):
+    """Hold the generation lock for a normalized location."""
+    with _SCRAPE_LOCKS_GUARD:
+        entry = _SCRAPE_LOCKS.get(location)
+        if entry is None:
+            entry = _SCRAPE_LOCKS[location] = [threading.Lock(), 0]
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _SCRAPE_LOCKS_GUARD:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _SCRAPE_LOCKS[location]
+
 
 class ActivityGenerator:
     """Generate activities using Gemini AI through Hack Club endpoint."""
@@ -36,9 +129,6 @@ class ActivityGenerator:
     def _get_google_image(self, query: str) -> str:
         """Get first image URL from Google Images search."""
         try:
-            import re
-            import urllib.parse
-            
             search_url = f"https://www.google.com/search?q={urllib.parse.quote(query)}&tbm=isch"
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -47,7 +137,7 @@ class ActivityGenerator:
                 'Accept-Encoding': 'gzip, deflate',
                 'Connection': 'keep-alive',
             }
-            response = requests.get(search_url, headers=headers, timeout=15)
+            response = _http.get(search_url, headers=headers, timeout=15)
             response.raise_for_status()
             
             html_content = response.text
@@ -58,7 +148,6 @@ class ActivityGenerator:
             
             if matches:
                 try:
-                    import json
                     # try to parse json data
                     for match in matches:
                         try:
@@ -111,12 +200,11 @@ class ActivityGenerator:
     def _get_duckduckgo_image(self, query: str) -> str:
         """Get image URL from DuckDuckGo image search (reliable, no API key needed)."""
         try:
-            import urllib.parse
             search_url = f"https://duckduckgo.com/?q={urllib.parse.quote(query)}&iax=images&ia=images"
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             }
-            response = requests.get(search_url, headers=headers, timeout=10)
+            response = _http.get(search_url, headers=headers, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -130,7 +218,6 @@ class ActivityGenerator:
             
             # also try finding images in script tags
             scripts = soup.find_all('script')
-            import re
             for script in scripts:
                 if script.string:
                     # look for image urls
@@ -151,11 +238,10 @@ class ActivityGenerator:
             if not api_key:
                 return ""
             
-            import urllib.parse
             encoded_query = urllib.parse.quote(query)
             search_url = f"https://api.pexels.com/v1/search?query={encoded_query}&per_page=1"
             headers = {"Authorization": api_key}
-            response = requests.get(search_url, headers=headers, timeout=10)
+            response = _http.get(search_url, headers=headers, timeout=10)
             
             if response.ok:
                 data = response.json()
@@ -176,6 +262,18 @@ class ActivityGenerator:
         except Exception:
             return ""
     
+    def _find_image(self, search_term: str) -> str:
+        """Get an image URL for a search term, trying each source in priority order."""
+        # try pexels first if api key is set (most reliable)
+        image_url = self._get_pexels_image(search_term)
+        if not image_url:
+            image_url = self._get_google_image(search_term)
+        if not image_url:
+            image_url = self._get_duckduckgo_image(search_term)
+        if not image_url:
+            image_url = self._get_unsplash_image(search_term)
+        return image_url
+    
     def _call_gemini(self, prompt: str) -> str:
         """Call Gemini API through Hack Club endpoint."""
         headers = {
@@ -194,7 +292,7 @@ class ActivityGenerator:
             "temperature": 0.7
         }
         
-        response = requests.post(self.api_url, headers=headers, json=payload, timeout=30)
+        response = _http.post(self.api_url, headers=headers, json=payload, timeout=30)
         response.raise_for_status()
         data = response.json()
         
@@ -244,8 +342,8 @@ Return ONLY valid JSON array, no markdown formatting:
             response_text = self._call_gemini(prompt)
             
             # Clean up markdown if present
-            text = response_text.strip()
-            text = text.replace("```json", "").replace("```", "").strip()
+            fence = _FENCE_RE.search(response_text)
+            text = fence.group(1) if fence else response_text
             
             # Extract JSON
             start = text.find("[")
@@ -255,20 +353,19 @@ Return ONLY valid JSON array, no markdown formatting:
             else:
                 json_text = text
             
-            parsed_data = json.loads(json_text)
+            parsed_data = orjson.loads(json_text)
+            
+            # Image lookups are independent network waits, so run them concurrently
+            search_terms = [
+                item.get("search_term", f"{item.get('name', '')} {location}").strip()
+                for item in parsed_data
+            ]
+            with ThreadPoolExecutor(max_workers=max(1, min(8, len(search_terms)))) as pool:
+                image_urls = list(pool.map(self._find_image, search_terms))
             
             # Add images and format
             structured_items = []
-            for item in parsed_data:
-                search_term = item.get("search_term", f"{item.get('name', '')} {location}").strip()
-                # try pexels first if api key is set (most reliable)
-                image_url = self._get_pexels_image(search_term)
-                if not image_url:
-                    image_url = self._get_google_image(search_term)
-                if not image_url:
-                    image_url = self._get_duckduckgo_image(search_term)
-                if not image_url:
-                    image_url = self._get_unsplash_image(search_term)
+            for item, image_url in zip(parsed_data, image_urls):
                 structured_item = {
                     "name": item.get("name", ""),
                     "description": item.get("description", ""),
@@ -293,34 +390,22 @@ Return ONLY valid JSON array, no markdown formatting:
         """Generate fallback activities when Gemini is unavailable."""
         print(f"Using fallback data generation for {location}")
         
-        templates = [
-            {"name": f"Historic {location} Walking Tour", "category": "Tour", "tags": ["walking", "history", "cultural"], "energy": "medium", "age": "cultural", "budget": "$25", "search": f"historic {location}"},
-            {"name": f"{location} City Museum", "category": "Museum", "tags": ["indoor", "art", "history"], "energy": "low", "age": "educational", "budget": "$15", "search": f"museum {location}"},
-            {"name": f"Central {location} Park", "category": "Park", "tags": ["outdoor", "relaxing", "nature"], "energy": "low", "age": "family-friendly", "budget": "free", "search": f"park {location}"},
-            {"name": f"{location} Main Cathedral", "category": "Temple", "tags": ["architecture", "spiritual", "historic"], "energy": "low", "age": "cultural", "budget": "free", "search": f"cathedral {location}"},
-            {"name": f"Local {location} Market", "category": "Attraction", "tags": ["shopping", "food", "local"], "energy": "medium", "age": "cultural", "budget": "$20", "search": f"market {location}"},
-            {"name": f"Traditional {location} Restaurant", "category": "Restaurant", "tags": ["dining", "authentic", "food"], "energy": "low", "age": "cultural", "budget": "$40", "search": f"restaurant {location}"},
-            {"name": f"{location} Art Gallery", "category": "Museum", "tags": ["art", "indoor", "cultural"], "energy": "low", "age": "educational", "budget": "$12", "search": f"art gallery {location}"},
-            {"name": f"{location} Riverfront Cruise", "category": "Tour", "tags": ["scenic", "relaxing", "water"], "energy": "low", "age": "family-friendly", "budget": "$35", "search": f"river cruise {location}"},
-            {"name": f"{location} Night Entertainment", "category": "Entertainment", "tags": ["nightlife", "music", "social"], "energy": "high", "age": "nightlife", "budget": "$50", "search": f"nightlife {location}"},
-            {"name": f"{location} Viewpoint Tower", "category": "Landmark", "tags": ["scenic", "views", "iconic"], "energy": "medium", "age": "cultural", "budget": "$18", "search": f"viewpoint {location}"},
-        ]
-        
-        structured_items = []
-        for i, template in enumerate(templates[:num_activities]):
-            structured_items.append({
-                "name": template["name"],
-                "description": f"Popular {template['category'].lower()} attraction in {location}",
+        # No image lookup here: the fallback runs when the network path has
+        # already failed, and the Unsplash source always came back empty
+        return [
+            {
+                "name": template["name"].format(location=location),
+                "description": template["description"].format(location=location),
                 "category": template["category"],
-                "tags": template["tags"],
+                "tags": list(template["tags"]),
                 "energy_level": template["energy"],
                 "age_suitability_profile": template["age"],
                 "budget": template["budget"],
-                "image_url": self._get_unsplash_image(template["search"]),
+                "image_url": "",
                 "location": location
-            })
-        
-        return structured_items
+            }
+            for template in _FALLBACK_TEMPLATES[:num_activities]
+        ]
     
     def _get_cache_path(self, location: str) -> Path:
         """Get cache file path for a location."""
@@ -329,6 +414,10 @@ Return ONLY valid JSON array, no markdown formatting:
     
     def _load_from_cache(self, location: str) -> Optional[List[Dict[str, Any]]]:
         """Load cached data if available and not expired."""
+        cached = _memory_cache_get(location)
+        if cached is not None:
+            return cached
+        
         cache_path = self._get_cache_path(location)
         
         if not cache_path.exists():
@@ -336,7 +425,8 @@ Return ONLY valid JSON array, no markdown formatting:
         
         try:
             # Check if cache is expired
-            cache_age = time.time() - cache_path.stat().st_mtime
+            mtime = cache_path.stat().st_mtime
+            cache_age = time.time() - mtime
             if cache_age > self.cache_ttl:
                 print(f"Cache expired for {location} (age: {cache_age / 3600:.1f} hours)")
                 cache_path.unlink()
@@ -347,7 +437,7 @@ Return ONLY valid JSON array, no markdown formatting:
                 cached_data = pickle.load(f)
             
             print(f"Loaded {len(cached_data)} items from cache for {location}")
-            print(f"Cache data: {json.dumps(cached_data, indent=2)}")
+            _memory_cache_put(location, mtime + self.cache_ttl, cached_data)
             return cached_data
         except Exception as e:
             print(f"Error loading cache: {e}")
@@ -355,6 +445,7 @@ Return ONLY valid JSON array, no markdown formatting:
     
     def _save_to_cache(self, location: str, data: List[Dict[str, Any]]):
         """Save scraped data to cache."""
+        _memory_cache_put(location, time.time() + self.cache_ttl, data)
         cache_path = self._get_cache_path(location)
         
         try:
@@ -399,13 +490,23 @@ def webscrape_location(database, location: str, max_activities: int = 10) -> Tup
     location = location.strip().title()
     
     # Step 1: Check if data already exists in new_db.json
-    places = database.get_places_by_destination(location)
-    activities = database.get_activities_by_destination(location)
+    places, activities = database.get_items_by_destination(location)
     
     if places and activities:
         print(f"Found {len(places)} places and {len(activities)} activities in new_db.json for {location}")
         return places, activities
     
+    with _scrape_lock(location):
+        # Another request may have generated this location while we waited
+        places, activities = database.get_items_by_destination(location)
+        if places and activities:
+            return places, activities
+        
+        return _generate_location(database, location, max_activities)
+
+
+def _generate_location(database, location: str, max_activities: int) -> Tuple[List[Place], List[Activity]]:
+    """Generate, convert and save data for a location with none in the database."""
     print(f"No data in new_db.json for {location}, generating new data...")
     
     # Step 2: Generate with Gemini if no data in new_db.json
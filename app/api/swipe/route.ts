@@ -16,7 +16,7 @@ export const POST = async (req: Request) => {
     }
 
     const body = await req.json();
-    const { itemId, action, destination, tripId } = body;
+    const { itemId, itemType, action, destination, tripId } = body;
 
     if (!itemId || !action || !destination) {
       return NextResponse.json({ error: 'Missing required fields' }, { status: 400 });
@@ -37,6 +37,7 @@ export const POST = async (req: Request) => {
       body: JSON.stringify({
         userId: session.user.id,
         itemId,
+        itemType,
         action,
         destination,
       }),
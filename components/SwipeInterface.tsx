@@ -459,6 +459,7 @@ export const SwipeInterface = ({
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({
           itemId: currentCard.id,
+          itemType: currentCard.type,
           action: direction,
           destination,
           tripId,
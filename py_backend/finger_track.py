@@ -32,13 +32,10 @@ class FingerTracking:
         self.last_n_frames = deque(maxlen=12)
 
     @staticmethod
-    def _lm_xy(hand_lms, idx, w, h):
-        lm = hand_lms.landmark[idx]
-        return np.array([lm.x * w, lm.y * h], dtype=np.float32)
-
-    def _compute_hand_center(self, hand_lms, w, h):
-        wrist = self._lm_xy(hand_lms, 0, w, h)
-        return wrist / np.array([w, h])
+    def _compute_hand_center(hand_lms):
+        # MediaPipe landmarks are already normalized, so read the wrist directly
+        lm = hand_lms.landmark[0]
+        return lm.x, lm.y
 
     def detect_swipe(self, min_frames: int = 8, required_fraction: float = 0.40,
                      min_total_dx_norm: float = 0.12, max_total_dy_norm: float = 0.12):
@@ -47,24 +44,27 @@ class FingerTracking:
 
         samples = list(self.q)[-min_frames:]
 
-        xs, ys = [], []
+        # Most frames are not a swipe, so gate on the end-to-end motion before
+        # building the per-step arrays
+        first = samples[0].get("center")
+        last = samples[-1].get("center")
+        if first is None or last is None:
+            return None
+
+        total_dx = float(last[0] - first[0])
+        total_dy = float(last[1] - first[1])
+
+        if abs(total_dx) < min_total_dx_norm or abs(total_dy) > max_total_dy_norm:
+            return 0
+
+        xs = []
         for s in samples:
             center = s.get("center")
             if center is None:
                 return None
             xs.append(center[0])
-            ys.append(center[1])
-
-        xs = np.array(xs, dtype=np.float32)
-        ys = np.array(ys, dtype=np.float32)
-
-        total_dx = float(xs[-1] - xs[0])
-        total_dy = float(ys[-1] - ys[0])
-
-        if abs(total_dx) < min_total_dx_norm or abs(total_dy) > max_total_dy_norm:
-            return 0
 
-        step_dx = np.diff(xs)
+        step_dx = np.diff(np.array(xs, dtype=np.float32))
         direction = 1.0 if total_dx > 0 else -1.0
         if float(np.mean((step_dx * direction) > 0)) < required_fraction:
             return 0
@@ -80,9 +80,7 @@ class FingerTracking:
         h, w = frame.shape[:2]
 
         rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        rgb.flags.writeable = False
         result = self.hands.process(rgb)
-        rgb.flags.writeable = True
 
         swipe = 0
 
@@ -96,7 +94,7 @@ class FingerTracking:
                 self.mp_styles.get_default_hand_connections_style(),
             )
 
-            center_norm = self._compute_hand_center(hand_lms, w, h)
+            center_norm = self._compute_hand_center(hand_lms)
             self.q.append({"center": center_norm, "w": w, "h": h})
 
             swipe = self.detect_swipe()
@@ -1,16 +1,10 @@
 import cv2
 import mediapipe as mp
-import numpy as np
 from collections import deque
 
 class HandPositionTracking:
-    FINGER_TIPS = {
-        "thumb": 4,
-        "index": 8,
-        "middle": 12,
-        "ring": 16,
-        "pinky": 20,
-    }
+    # Landmark indices of the thumb, index, middle, ring and pinky tips
+    FINGER_TIP_IDS = (4, 8, 12, 16, 20)
 
     def __init__(self, cam_index: int = 0, queue_len: int = 10):
         self.cap = cv2.VideoCapture(cam_index, cv2.CAP_DSHOW)
@@ -33,19 +27,15 @@ class HandPositionTracking:
         self.last_known_x = 0.50
         self.last_known_y = 0.50
 
-    @staticmethod
-    def _lm_xy(hand_lms, idx, w, h):
-        lm = hand_lms.landmark[idx]
-        return np.array([lm.x * w, lm.y * h], dtype=np.float32)
-
-    def _compute_hand_center(self, hand_lms, w, h):
-        fingertip_positions = []
-        for finger_name, tip_idx in self.FINGER_TIPS.items():
-            tip_pos = self._lm_xy(hand_lms, tip_idx, w, h)
-            fingertip_positions.append(tip_pos)
-        
-        avg_position = np.mean(fingertip_positions, axis=0)
-        return avg_position / np.array([w, h])
+    def _compute_hand_center(self, hand_lms):
+        # Landmarks are already normalized to [0, 1], so average them directly
+        landmarks = hand_lms.landmark
+        sx = sy = 0.0
+        for tip_idx in self.FINGER_TIP_IDS:
+            lm = landmarks[tip_idx]
+            sx += lm.x
+            sy += lm.y
+        return sx * 0.2, sy * 0.2
 
     def get_fracs(self):
         ok, frame = self.cap.read()
@@ -56,9 +46,7 @@ class HandPositionTracking:
         h, w = frame.shape[:2]
 
         rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        rgb.flags.writeable = False
         result = self.hands.process(rgb)
-        rgb.flags.writeable = True
 
         x_frac = self.last_known_x  # Default to last known
         y_frac = self.last_known_y
@@ -73,9 +61,7 @@ class HandPositionTracking:
                 self.mp_styles.get_default_hand_connections_style(),
             )
 
-            center_norm = self._compute_hand_center(hand_lms, w, h)
-            x_frac = float(center_norm[0])
-            y_frac = float(center_norm[1])
+            x_frac, y_frac = self._compute_hand_center(hand_lms)
             
             # Clamp to [0, 1] range
             x_frac = min(1.0, max(0.0, x_frac))